@@ -7,6 +7,7 @@ based on the artifact_managed_header_items.json configuration.
 import json
 import re
 from pathlib import Path
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
 import logging
 
@@ -37,7 +38,33 @@ class ArtifactHeaderManager:
         
         self.type_manager = type_manager or ArtifactTypeManager()
         self._config = self._load_config()
-        
+
+        # Compile each type's header-format pattern once; the type config
+        # is static for the life of the process
+        self._header_patterns: List[tuple[str, re.Pattern]] = []
+        for artifact_type, type_info in self.type_manager._config['artifact_types'].items():
+            header_format = type_info.get('header_format', '')
+            if not header_format:
+                continue
+
+            # Convert format template to regex pattern
+            # e.g., "# PRD-{id}: {description}" -> r"# PRD-(\d+): (.+)"
+            escaped_format = re.escape(header_format)
+            pattern = escaped_format.replace(r'\{id\}', r'(\d+)').replace(r'\{description\}', r'(.+)')
+            try:
+                self._header_patterns.append((artifact_type, re.compile(pattern)))
+            except re.error as e:
+                logger.warning(f"Regex error for pattern '{pattern}': {e}")
+
+        # Type extraction only depends on the first line, so memoize on that
+        self._extract_cached = lru_cache(maxsize=256)(self._extract_from_first_line)
+
+        # Memoize header parsing per content string: update flows re-parse
+        # the same artifact text repeatedly (status update, covering-tests
+        # pass, rebuild), and a content key is exact — any edit produces a
+        # different string and therefore a fresh parse
+        self._parse_cached = lru_cache(maxsize=256)(self._parse_managed_headers_uncached)
+
         logger.info(f"Initialized ArtifactHeaderManager with config: {self.config_path}")
     
     def _load_config(self) -> Dict:
@@ -81,36 +108,20 @@ class ArtifactHeaderManager:
         Returns:
             Tuple of (artifact_type, artifact_id) if found, None otherwise
         """
-        lines = content.strip().split('\n')
-        if not lines:
+        first_line = content.strip().split('\n', 1)[0].strip()
+        if not first_line:
             return None
-            
-        first_line = lines[0].strip()
-        
-        # Try to match against all known header formats
-        for artifact_type, type_info in self.type_manager._config['artifact_types'].items():
-            header_format = type_info.get('header_format', '')
-            if not header_format:
-                continue
-                
-            # Convert format template to regex pattern
-            # e.g., "# PRD-{id}: {description}" -> r"# PRD-(\d+): (.+)"
-            # e.g., "### REQ-{id}: {description}" -> r"### REQ-(\d+): (.+)"
-            
-            # Escape the format string and then replace the placeholders
-            escaped_format = re.escape(header_format)
-            # Replace escaped placeholders with regex groups
-            pattern = escaped_format.replace(r'\{id\}', r'(\d+)').replace(r'\{description\}', r'(.+)')
-            
-            try:
-                match = re.match(pattern, first_line)
-                if match:
-                    artifact_id = match.group(1)
-                    return artifact_type, f"{artifact_type}-{artifact_id}"
-            except re.error as e:
-                logger.warning(f"Regex error for pattern '{pattern}': {e}")
-                continue
-        
+
+        return self._extract_cached(first_line)
+
+    def _extract_from_first_line(self, first_line: str) -> Optional[tuple[str, str]]:
+        """Match a header line against the precompiled type patterns."""
+        for artifact_type, pattern in self._header_patterns:
+            match = pattern.match(first_line)
+            if match:
+                artifact_id = match.group(1)
+                return artifact_type, f"{artifact_type}-{artifact_id}"
+
         return None
     
     def get_managed_headers_for_type(self, artifact_type: str) -> Dict[str, Dict]:
@@ -132,26 +143,51 @@ class ArtifactHeaderManager:
     
     def parse_managed_headers(self, content: str) -> tuple[str, Dict[str, str], str]:
         """Parse artifact content to extract header line, managed headers, and body.
-        
+
         Args:
             content: The full artifact content string
-            
+
         Returns:
             Tuple of (header_line, managed_headers_dict, remaining_content)
         """
+        header_line, managed_headers, remaining_content, _, _ = self.parse_managed_headers_full(content)
+        return header_line, managed_headers, remaining_content
+
+    def parse_managed_headers_full(self, content: str) -> tuple[str, Dict[str, str], str, Optional[str], Dict[str, Dict]]:
+        """Parse artifact content, also returning the type and header config.
+
+        The artifact type and its applicable managed headers are resolved
+        during the parse anyway, so callers that need them afterwards can
+        take them from this tuple instead of rescanning the header block.
+
+        Results are memoized per content string, so the returned dicts are
+        shared between calls — callers must copy them before mutating.
+
+        Args:
+            content: The full artifact content string
+
+        Returns:
+            Tuple of (header_line, managed_headers_dict, remaining_content,
+            artifact_type, applicable_headers_config). The last two are
+            None/empty when the artifact type cannot be determined.
+        """
+        return self._parse_cached(content)
+
+    def _parse_managed_headers_uncached(self, content: str) -> tuple[str, Dict[str, str], str, Optional[str], Dict[str, Dict]]:
+        """Uncached implementation behind parse_managed_headers_full."""
         lines = content.strip().split('\n')
         if not lines:
-            return "", {}, ""
-        
+            return "", {}, "", None, {}
+
         header_line = lines[0].strip()
         managed_headers = {}
         body_start_index = 1
-        
+
         # Extract artifact type to know which headers to look for
         artifact_info = self.extract_artifact_type_and_id(content)
         if not artifact_info:
-            return header_line, {}, '\n'.join(lines[1:])
-        
+            return header_line, {}, '\n'.join(lines[1:]), None, {}
+
         artifact_type, _ = artifact_info
         applicable_headers = self.get_managed_headers_for_type(artifact_type)
         
@@ -184,8 +220,8 @@ class ArtifactHeaderManager:
                 break
         
         remaining_content = '\n'.join(lines[body_start_index:])
-        return header_line, managed_headers, remaining_content
-    
+        return header_line, managed_headers, remaining_content, artifact_type, applicable_headers
+
     def update_managed_header(self, content: str, header_updates: Dict[str, str]) -> str:
         """Update managed header values in artifact content.
         
@@ -196,20 +232,17 @@ class ArtifactHeaderManager:
         Returns:
             Updated artifact content with modified headers
         """
-        # Parse the current content
-        header_line, current_headers, body_content = self.parse_managed_headers(content)
-        
+        # Parse the current content; the fused parse also yields the
+        # artifact type and header config without rescanning the header
+        header_line, current_headers, body_content, artifact_type, applicable_headers = \
+            self.parse_managed_headers_full(content)
+
         if not header_line:
             raise ValueError("Could not parse artifact header from content")
-        
-        # Extract artifact type
-        artifact_info = self.extract_artifact_type_and_id(content)
-        if not artifact_info:
+
+        if not artifact_type:
             raise ValueError("Could not determine artifact type from content")
         
-        artifact_type, _ = artifact_info
-        applicable_headers = self.get_managed_headers_for_type(artifact_type)
-        
         # Update headers
         updated_headers = current_headers.copy()
         
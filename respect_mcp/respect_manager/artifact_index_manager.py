@@ -206,6 +206,21 @@ Format: {','.join(self.COLUMN_NAMES)}
                 return artifact
         return None
     
+    def get_status(self, artifact_id: str) -> Optional[str]:
+        """Get the current status of an artifact from the index.
+
+        Args:
+            artifact_id: The artifact ID to look up
+
+        Returns:
+            The artifact's status string, or None if the artifact is not found
+            or has no status recorded
+        """
+        artifact = self.get_artifact_by_id(artifact_id)
+        if artifact:
+            return artifact.get("status")
+        return None
+
     def get_artifact_by_doc_id(self, doc_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific artifact by its document ID.
         
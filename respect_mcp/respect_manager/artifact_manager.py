@@ -9,6 +9,7 @@ The ID component is unique and sequential, stored in an index.md file at the rep
 import os
 import fcntl
 import re
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional, Dict, Set, Any, List, Tuple
 import logging
@@ -33,7 +34,60 @@ class ArtifactManager:
             repo_root: Path to the root of the ReSpecT repository
         """
         self.repo_root = Path(repo_root)
-    
+        # Write-back cache used by batch_updates(); None when not batching
+        self._batch_cache: Optional[Dict[str, str]] = None
+        self._batch_dirty: Set[str] = set()
+
+    @contextmanager
+    def batch_updates(self):
+        """Coalesce artifact file writes inside the context into one write per file.
+
+        Loops that update many embedded artifacts (e.g., the REQs touched by
+        a TASK or UACC status change) otherwise rewrite the same containing
+        file once per artifact. Inside this context, reads and writes of
+        non-file artifacts go through an in-memory cache and each dirty file
+        is flushed to disk exactly once on exit.
+
+        Nested contexts share the outermost cache and flush when the
+        outermost context exits.
+        """
+        if self._batch_cache is not None:
+            # Already batching; let the outermost context flush
+            yield self
+            return
+
+        self._batch_cache = {}
+        self._batch_dirty = set()
+        try:
+            yield self
+        finally:
+            cache, dirty = self._batch_cache, self._batch_dirty
+            self._batch_cache = None
+            self._batch_dirty = set()
+            for path in dirty:
+                with open(path, 'w', encoding='utf-8', buffering=65536) as f:
+                    f.write(cache[path])
+
+    def _read_artifact_file(self, file_path: Path) -> str:
+        """Read an artifact file, consulting the batch cache when active."""
+        if self._batch_cache is not None:
+            key = str(file_path)
+            content = self._batch_cache.get(key)
+            if content is None:
+                content = file_path.read_text(encoding='utf-8')
+                self._batch_cache[key] = content
+            return content
+        return file_path.read_text(encoding='utf-8')
+
+    def _write_artifact_file(self, file_path: Path, content: str) -> None:
+        """Write an artifact file, deferring to batch flush when active."""
+        if self._batch_cache is not None:
+            key = str(file_path)
+            self._batch_cache[key] = content
+            self._batch_dirty.add(key)
+            return
+        file_path.write_text(content, encoding='utf-8')
+
     @staticmethod
     def get_version() -> str:
         """Return the artifact_manager module version string.
@@ -393,7 +447,94 @@ class ArtifactManager:
 
         except Exception as e:
             return {"success": False, "message": f"Error updating artifact: {str(e)}"}
-    
+
+    def get_artifacts_bulk(self, identifiers: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get the contents of several artifacts in one repository pass.
+
+        Equivalent to calling get_artifact once per identifier, but the
+        index is read once for all lookups and every requested non-file
+        artifact is extracted during a single walk of the markdown files
+        instead of one walk per artifact.
+
+        Args:
+            identifiers: Document IDs (digits) or artifact IDs to fetch
+
+        Returns:
+            Dictionary mapping each resolved artifact ID (or the original
+            identifier when it cannot be resolved) to a get_artifact-style
+            result dictionary
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+
+        try:
+            repo_root = os.getenv("RESPECT_DOC_REPO_ROOT")
+            if not repo_root:
+                return {
+                    str(identifier): {"success": False, "message": "RESPECT_DOC_REPO_ROOT environment variable not set"}
+                    for identifier in identifiers
+                }
+            repo_path = Path(repo_root)
+            if not repo_path.exists():
+                return {
+                    str(identifier): {"success": False, "message": f"Document repository not found at {repo_root}"}
+                    for identifier in identifiers
+                }
+
+            # Resolve all identifiers against one index read
+            index_manager = get_artifact_index_manager(str(self.repo_root))
+            all_artifacts = index_manager.get_all_artifacts()
+            info_by_id = {entry.get("artifact_id"): entry for entry in all_artifacts}
+            id_by_doc_id = {str(entry.get("doc_id")): entry.get("artifact_id") for entry in all_artifacts}
+
+            # Non-file artifacts still wanted, keyed by their section heading
+            pending: Dict[str, Dict[str, Any]] = {}
+
+            for identifier in identifiers:
+                identifier = str(identifier)
+                artifact_id = id_by_doc_id.get(identifier) if identifier.isdigit() else identifier.upper()
+                artifact_info = info_by_id.get(artifact_id)
+                if not artifact_info:
+                    results[identifier] = {"success": False, "message": f"No artifact found for identifier: {identifier}"}
+                    continue
+
+                if artifact_info.get("is_file", False):
+                    results[artifact_id] = self._get_file_artifact(artifact_id, artifact_info, repo_path)
+                else:
+                    pending[artifact_id] = artifact_info
+
+            # One walk collects every remaining non-file artifact
+            for file_path in repo_path.rglob("*.md"):
+                if not pending:
+                    break
+                try:
+                    content = self._read_artifact_file(file_path)
+                except (UnicodeDecodeError, PermissionError):
+                    continue
+
+                for artifact_id in [aid for aid in pending if f"### {aid}" in content]:
+                    section = self._extract_non_file_section(content, artifact_id)
+                    if section is None:
+                        continue
+                    artifact_info = pending.pop(artifact_id)
+                    results[artifact_id] = {
+                        "success": True,
+                        "content": section,
+                        "file_path": str(file_path),
+                        "artifact_info": artifact_info,
+                        "message": f"Successfully retrieved content for non-file artifact {artifact_id}"
+                    }
+
+            for artifact_id in pending:
+                results[artifact_id] = {"success": False, "message": f"No content found for non-file artifact {artifact_id}"}
+
+            return results
+
+        except Exception as e:
+            logger.error(f"Error in bulk artifact retrieval: {e}")
+            for identifier in identifiers:
+                results.setdefault(str(identifier), {"success": False, "message": f"Error retrieving artifact: {str(e)}"})
+            return results
+
     def _get_file_artifact(self, artifact_id: str, artifact_info: Dict[str, Any], repo_path: Path) -> Dict[str, Any]:
         """Get content for file-based artifacts."""
         # Search for files that start with the artifact ID and end with .md
@@ -477,41 +618,57 @@ class ArtifactManager:
         except (UnicodeDecodeError, PermissionError) as e:
             return {"success": False, "message": f"Error writing file {found_file}: {str(e)}"}
     
+    def _extract_non_file_section(self, content: str, artifact_id: str) -> Optional[str]:
+        """Extract an embedded artifact's section from its containing document.
+
+        The section runs from the ``### <ARTIFACT-ID>`` heading to the next
+        ``###`` heading or end of file.
+
+        Args:
+            content: Full content of the containing document
+            artifact_id: The embedded artifact's ID
+
+        Returns:
+            The section content (heading included, trailing whitespace
+            stripped), or None if the heading is not present
+        """
+        lines = content.split('\n')
+
+        # Look for the artifact heading (### ARTIFACT-ID)
+        for i, line in enumerate(lines):
+            if line.strip().startswith(f"### {artifact_id}"):
+                # Extract content from this heading to the next ### heading or end of file
+                artifact_lines = [line]  # Include the heading line
+
+                # Collect lines until next ### heading or end of file
+                for j in range(i + 1, len(lines)):
+                    next_line = lines[j]
+                    # Stop if we hit another ### heading
+                    if next_line.strip().startswith("### ") and not next_line.strip().startswith(f"### {artifact_id}"):
+                        break
+                    artifact_lines.append(next_line)
+
+                return '\n'.join(artifact_lines).rstrip()
+
+        return None
+
     def _get_non_file_artifact(self, artifact_id: str, artifact_info: Dict[str, Any], repo_path: Path) -> Dict[str, Any]:
         """Get content for non-file artifacts embedded in other documents."""
         # Search all markdown files for the artifact heading
         found_file = None
         artifact_content = None
-        
+
         for file_path in repo_path.rglob("*.md"):
             try:
-                content = file_path.read_text(encoding='utf-8')
-                lines = content.split('\n')
-                
-                # Look for the artifact heading (### ARTIFACT-ID)
-                for i, line in enumerate(lines):
-                    if line.strip().startswith(f"### {artifact_id}"):
-                        found_file = file_path
-                        # Extract content from this heading to the next ### heading or end of file
-                        artifact_lines = [line]  # Include the heading line
-                        
-                        # Collect lines until next ### heading or end of file
-                        for j in range(i + 1, len(lines)):
-                            next_line = lines[j]
-                            # Stop if we hit another ### heading
-                            if next_line.strip().startswith("### ") and not next_line.strip().startswith(f"### {artifact_id}"):
-                                break
-                            artifact_lines.append(next_line)
-                        
-                        artifact_content = '\n'.join(artifact_lines).rstrip()
-                        break
-                
-                if artifact_content:
-                    break
-                    
+                content = self._read_artifact_file(file_path)
             except (UnicodeDecodeError, PermissionError):
                 continue
-        
+
+            artifact_content = self._extract_non_file_section(content, artifact_id)
+            if artifact_content:
+                found_file = file_path
+                break
+
         if not found_file or not artifact_content:
             return {"success": False, "message": f"No content found for non-file artifact {artifact_id}"}
         
@@ -523,13 +680,16 @@ class ArtifactManager:
             "message": f"Successfully retrieved content for non-file artifact {artifact_id}"
         }
     
-    def _update_non_file_artifact(self, artifact_id: str, new_content: str) -> Dict[str, Any]:
+    def _update_non_file_artifact(self, artifact_id: str, new_content: str, file_hint: Optional[str] = None) -> Dict[str, Any]:
         """Update content for non-file artifacts embedded in other documents.
-        
+
         Args:
             artifact_id: The artifact ID to update
             new_content: The new content to replace the existing artifact section with
-            
+            file_hint: Optional path to the file known to contain the artifact
+                      section (e.g., from a preceding get_artifact call). Tried
+                      first so the repository walk can be skipped on a hit.
+
         Returns:
             Dictionary with update results including success status and file path
         """
@@ -537,19 +697,29 @@ class ArtifactManager:
         repo_root = os.getenv("RESPECT_DOC_REPO_ROOT")
         if not repo_root:
             return {"success": False, "message": "RESPECT_DOC_REPO_ROOT environment variable not set"}
-        
+
         repo_path = Path(repo_root)
         if not repo_path.exists():
             return {"success": False, "message": f"Document repository not found at {repo_root}"}
-        
-        # Search all markdown files for the artifact heading
+
+        # Search candidate markdown files for the artifact heading, trying the
+        # hinted file first when the caller already resolved it
+        def _candidate_files():
+            hint_path = Path(file_hint) if file_hint else None
+            if hint_path and hint_path.is_file():
+                yield hint_path
+            for path in repo_path.rglob("*.md"):
+                if hint_path and path == hint_path:
+                    continue
+                yield path
+
         found_file = None
         start_index = None
         end_index = None
-        
-        for file_path in repo_path.rglob("*.md"):
+
+        for file_path in _candidate_files():
             try:
-                content = file_path.read_text(encoding='utf-8')
+                content = self._read_artifact_file(file_path)
                 lines = content.split('\n')
                 
                 # Look for the artifact heading (### ARTIFACT-ID)
@@ -583,18 +753,24 @@ class ArtifactManager:
         
         try:
             # Read the current content
-            content = found_file.read_text(encoding='utf-8')
+            content = self._read_artifact_file(found_file)
             lines = content.split('\n')
-            
+
             # Ensure new_content doesn't have trailing newlines that would create extra blank lines
             new_content_lines = new_content.rstrip('\n').split('\n')
-            
+
             # Replace the artifact section with new content
             updated_lines = lines[:start_index] + new_content_lines + lines[end_index:]
-            
-            # Write the updated content back to the file
-            found_file.write_text('\n'.join(updated_lines), encoding='utf-8')
-            
+
+            # Write the updated content back to the file (deferred when batching)
+            self._write_artifact_file(found_file, '\n'.join(updated_lines))
+
+            # A rewritten REQ may change its COVERING_TESTS header, so drop
+            # the handlers' cached reverse index
+            if artifact_id.startswith("REQ-"):
+                from .artifact_type_handler import invalidate_covering_tests_index
+                invalidate_covering_tests_index()
+
             return {
                 "success": True,
                 "file_path": str(found_file),
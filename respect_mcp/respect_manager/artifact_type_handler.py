@@ -6,24 +6,272 @@ performs post-processing activities.
 """
 
 import logging
+import os
+import re
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 
+from .artifact_index_manager import get_artifact_index_manager
+
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns for hot parsing paths. Compiling once at import time
+# lets every call reuse the compiled pattern instead of recompiling per TASK.
+_REQ_ID_PATTERN = re.compile(r'\bREQ-\d+\b')
+_TASK_SECTION_HEADER_PATTERN = re.compile(r'^###\s+(TASK-\d+):')
+_TASK_BLOCK_RE = re.compile(r'^###\s+(TASK-\d+):.*?(?=^###\s+TASK-|\Z)', re.MULTILINE | re.DOTALL)
+_IMPLEMENTS_LINE_RE = re.compile(r'^\s*\*Implements\*:\s*([^\n]+)', re.MULTILINE)
+
+# Batch size at which TASKPRD finalize dispatches REQ updates to a thread pool
+_PARALLEL_REQ_UPDATE_THRESHOLD = 8
+_VERSION_FOOTER_RE = re.compile(r"<!--\s*ReSpecT\s+v[\d.]+\s*-->")
+_ACCEPTANCE_HEADER_RE = re.compile(r"^\s*##\s+Acceptance Tests\s*$", re.MULTILINE)
+
+
+def _find_version_footer(content: str):
+    """Locate the ReSpecT version footer, scanning the tail first.
+
+    The footer is conventionally the last line of the file, so a search
+    restricted to the final few hundred characters usually succeeds
+    without walking the whole document; the full scan only runs as a
+    fallback for unconventional layouts.
+
+    Returns:
+        The footer regex match, or None if no footer is present.
+    """
+    tail_start = max(0, len(content) - 256)
+    match = _VERSION_FOOTER_RE.search(content, tail_start)
+    if match or tail_start == 0:
+        return match
+    return _VERSION_FOOTER_RE.search(content)
+_NEXT_H2_RE = re.compile(r"^\s*##\s+", re.MULTILINE)
+
+
+def _strip_status(task_entry: str) -> str:
+    """Return the bare TASK id from a 'TASK-N (STATUS)' header entry."""
+    return task_entry.split(' (', 1)[0].strip()
+
+
+@lru_cache(maxsize=256)
+def _covering_test_entry_re(artifact_id: str) -> re.Pattern:
+    """Cached matcher for one covering-test entry with an optional status.
+
+    Matches the artifact id at an entry boundary (not inside a longer id
+    like UACC-17 when looking for UACC-1) plus any trailing '(STATUS)'.
+    """
+    return re.compile(
+        r'(?<![A-Za-z0-9_-])' + re.escape(artifact_id) + r'(?!\d)(\s*\([^)]*\))?'
+    )
+
+
+def _mark_step_done_in_content(content: str, step_number: str) -> Optional[str]:
+    """Flip the '[ ]' checkbox of a step line to '[x]' via string splicing.
+
+    Locates the '[ ] <step> <description>' line with substring searches
+    instead of splitting the whole document into lines, then replaces just
+    the three checkbox bytes.
+
+    Args:
+        content: The full artifact content string
+        step_number: The step number to mark as done (e.g., "10.1")
+
+    Returns:
+        The updated content, or None if no open step line was found
+    """
+    step_prefix = f'[ ] {step_number} '
+    if content.startswith(step_prefix):
+        idx = 0
+    else:
+        nl_idx = content.find(f'\n{step_prefix}')
+        if nl_idx == -1:
+            return None
+        idx = nl_idx + 1
+
+    # The step line must carry a non-empty description after the prefix
+    desc_start = idx + len(step_prefix)
+    line_end = content.find('\n', desc_start)
+    if line_end == -1:
+        line_end = len(content)
+    if desc_start >= line_end:
+        return None
+
+    return content[:idx] + '[x]' + content[idx + 3:]
+
+
 # We'll import get_artifact_id_manager locally in functions to avoid circular imports
 # This eliminates the module-level import complexity
 
+# Shared ArtifactHeaderManager instance. The header manager is stateless, so a
+# single lazily-created instance can be shared by all handlers instead of
+# constructing a fresh one per handler instantiation.
+_HEADER_MANAGER = None
+
+
+def _header_manager():
+    """Get the shared ArtifactHeaderManager instance, creating it on first use."""
+    global _HEADER_MANAGER
+    if _HEADER_MANAGER is None:
+        # Import locally to avoid circular imports
+        from .artifact_header_manager import ArtifactHeaderManager
+        _HEADER_MANAGER = ArtifactHeaderManager()
+    return _HEADER_MANAGER
+
+
+# Shared ArtifactManager instance, keyed by the configured repository root.
+# get_artifact_id_manager constructs a fresh manager per call, so handlers
+# reuse one instance instead of rebuilding it inside every finalize/update.
+_ARTIFACT_MANAGER = None
+
+
+def _artifact_manager():
+    """Get the shared ArtifactManager for the configured repository root.
+
+    A change to RESPECT_DOC_REPO_ROOT invalidates the cached instance so the
+    cache never pins a stale repository path.
+    """
+    global _ARTIFACT_MANAGER
+    repo_root = os.getenv('RESPECT_DOC_REPO_ROOT')
+    if _ARTIFACT_MANAGER is None or str(_ARTIFACT_MANAGER.repo_root) != repo_root:
+        # Import locally to avoid circular imports
+        from .artifact_manager import get_artifact_id_manager
+        _ARTIFACT_MANAGER = get_artifact_id_manager(repo_root)
+    return _ARTIFACT_MANAGER
+
+
+# Shared ArtifactIndexManager instance, keyed by the configured repository
+# root. The manager holds no mutable state (every operation re-reads the
+# index file), so one instance can serve all handlers.
+_INDEX_MANAGER = None
+
+
+def _index_manager():
+    """Get the shared ArtifactIndexManager for the configured repository root.
+
+    A change to RESPECT_DOC_REPO_ROOT invalidates the cached instance so the
+    cache never pins a stale repository path.
+
+    Raises:
+        ValueError: If RESPECT_DOC_REPO_ROOT is not set
+    """
+    global _INDEX_MANAGER
+    repo_root = os.getenv('RESPECT_DOC_REPO_ROOT')
+    if not repo_root:
+        raise ValueError("RESPECT_DOC_REPO_ROOT environment variable not set")
+    if _INDEX_MANAGER is None or str(_INDEX_MANAGER.repo_root) != repo_root:
+        _INDEX_MANAGER = get_artifact_index_manager(repo_root)
+    return _INDEX_MANAGER
+
+
+# Lazily built reverse index mapping covering-test ids (UACC/SACC) to the
+# REQ ids whose COVERING_TESTS header references them. Building it costs one
+# scan over all REQs; each status update is then an O(1) lookup instead of a
+# full rescan. Keyed by repository root and dropped whenever a REQ changes.
+_COVERING_TESTS_INDEX = None
+_COVERING_TESTS_INDEX_ROOT = None
+
+
+def invalidate_covering_tests_index() -> None:
+    """Drop the cached covering-tests reverse index.
+
+    Called whenever a REQ artifact is rewritten, since its COVERING_TESTS
+    header may have changed.
+    """
+    global _COVERING_TESTS_INDEX
+    _COVERING_TESTS_INDEX = None
+
+
+def _covering_tests_index(artifact_manager) -> Dict[str, set]:
+    """Get the reverse index of covering-test ids to referencing REQ ids.
+
+    Args:
+        artifact_manager: The ArtifactManager used to read REQ contents
+
+    Returns:
+        Dictionary mapping test artifact IDs (e.g., "UACC-17") to the set
+        of REQ IDs whose COVERING_TESTS header references them
+    """
+    global _COVERING_TESTS_INDEX, _COVERING_TESTS_INDEX_ROOT
+    repo_root = os.getenv('RESPECT_DOC_REPO_ROOT')
+    if _COVERING_TESTS_INDEX is not None and _COVERING_TESTS_INDEX_ROOT == repo_root:
+        return _COVERING_TESTS_INDEX
+
+    index: Dict[str, set] = {}
+    index_manager = _index_manager()
+    req_ids = [
+        entry.get("artifact_id", "")
+        for entry in index_manager.get_all_artifacts()
+        if entry.get("artifact_id", "").startswith("REQ-")
+    ]
+
+    # One repository pass for all REQ contents instead of a walk per REQ
+    req_results = artifact_manager.get_artifacts_bulk(req_ids)
+
+    # C-level substring pre-filter: only REQs whose raw section contains
+    # the covering-tests label at all are worth a header parse
+    covering_prefix = dict(_header_line_prefixes("REQ")).get('COVERING_TESTS')
+
+    for req_id in req_ids:
+        req_result = req_results.get(req_id) or {}
+        if not req_result.get("success"):
+            continue
+        content = req_result["content"]
+        if covering_prefix and covering_prefix not in content:
+            continue
+        _, headers, _ = _header_manager().parse_managed_headers(content)
+        for test in headers.get('COVERING_TESTS', '').split(','):
+            test_id = _strip_status(test)
+            if test_id:
+                index.setdefault(test_id, set()).add(req_id)
+
+    _COVERING_TESTS_INDEX = index
+    _COVERING_TESTS_INDEX_ROOT = repo_root
+    return index
+
+
+def _atomic_write_text(path: Path, text: str, encoding: str = 'utf-8') -> None:
+    """Write text to a file atomically via a temp file and os.replace.
+
+    A crash mid-write leaves the original artifact intact instead of a
+    truncated file.
+    """
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    tmp_path.write_text(text, encoding=encoding)
+    os.replace(tmp_path, path)
+
+
+@lru_cache(maxsize=16)
+def _applicable_headers(artifact_type: str):
+    """Cached lookup of the managed header items for an artifact type.
+
+    The header config is static for the life of the process, so repeated
+    update loops can share one lookup per type instead of rebuilding the
+    applicable-headers dict on every artifact rewrite.
+    """
+    return _header_manager().get_managed_headers_for_type(artifact_type)
+
+
+@lru_cache(maxsize=16)
+def _header_line_prefixes(artifact_type: str) -> tuple:
+    """Cached "`Label`: " prefixes for an artifact type's managed headers.
+
+    Content rebuilds emit one line per managed header; precomputing the
+    formatted prefix per type avoids re-stripping and re-formatting every
+    label on every rewrite.
+
+    Returns:
+        Tuple of (item_key, line_prefix) pairs in config order.
+    """
+    return tuple(
+        (item_key, f"`{item_config['label'].rstrip(':')}`: ")
+        for item_key, item_config in _applicable_headers(artifact_type).items()
+    )
+
 
 class ArtifactHandler(ABC):
     """Abstract base class for artifact handlers."""
-    
-    def __init__(self):
-        """Initialize the artifact handler with the header manager."""
-        from .artifact_header_manager import ArtifactHeaderManager
-        self._header_manager = ArtifactHeaderManager()
-    
+
     def finalize(self, artifact_id: str, id_mapping: Dict[str, str]) -> Dict[str, Any]:
         """Perform post-finalization activities for this artifact type.
         
@@ -47,6 +295,26 @@ class ArtifactHandler(ABC):
             "actions_performed": ["No post-processing required for this artifact type"]
         }
     
+    def _get_index_manager(self):
+        """Get an ArtifactIndexManager for the configured document repository.
+
+        Raises:
+            ValueError: If RESPECT_DOC_REPO_ROOT is not set
+        """
+        return _index_manager()
+
+    def _is_noop_status_update(self, artifact_id: str, status: str) -> bool:
+        """Check whether the artifact already has the requested status in the index.
+
+        Used to short-circuit idempotent retries (e.g., finalize re-setting a TASK
+        to NEW) before paying for the index rewrite, content update, and file move.
+        """
+        try:
+            return self._get_index_manager().get_status(artifact_id) == status
+        except Exception:
+            # If the index can't be consulted, fall through to the full update
+            return False
+
     def update_status_in_index(self, artifact_id: str, status: str) -> Dict[str, Any]:
         """Update the status of an artifact in the index.
         
@@ -61,17 +329,8 @@ class ArtifactHandler(ABC):
             Dictionary with update results
         """
         try:
-            # Import locally to avoid circular imports
-            from .artifact_index_manager import get_artifact_index_manager
-            
-            # Get the document repository root
-            import os
-            repo_root = os.getenv("RESPECT_DOC_REPO_ROOT")
-            if not repo_root:
-                raise ValueError("RESPECT_DOC_REPO_ROOT environment variable not set")
-            
             # Update the index
-            index_manager = get_artifact_index_manager(repo_root)
+            index_manager = self._get_index_manager()
             success = index_manager.update_artifact(artifact_id, status=status)
             
             if not success:
@@ -109,12 +368,16 @@ class ArtifactHandler(ABC):
             Dictionary with combined update results
         """
         try:
+            # Fail-fast: skip index, content, and move work when nothing changes
+            if self._is_noop_status_update(artifact_id, status):
+                return {"success": True, "message": f"{artifact_id} already {status}; no-op"}
+
             # Step 1: Always update index first
             index_result = self.update_status_in_index(artifact_id, status)
-            
+
             # Step 2: Let subclass handle content-specific updates
             content_result = self.update_status_content(artifact_id, status, artifact_manager)
-            
+
             # Step 3: Combine results
             return self._combine_update_results(index_result, content_result, artifact_id, status)
             
@@ -209,8 +472,6 @@ class ArtifactHandler(ABC):
         """
         try:
             from .artifact_type_manager import get_artifact_type_manager
-            from pathlib import Path
-            import os
             
             # Get artifact type and check if status triggers file move
             type_manager = get_artifact_type_manager()
@@ -269,6 +530,13 @@ class ArtifactHandler(ABC):
         Returns:
             Updated content with metadata properly managed
         """
+        # Fast path: a bare Status update can be patched in place on the line
+        # after the header, skipping the full managed-header reparse
+        if len(updates) == 1 and 'Status' in updates:
+            fast_result = self._fast_set_status_line(content, updates['Status'])
+            if fast_result is not None:
+                return fast_result
+
         try:
             # Convert old-style key names to new header item keys
             header_updates = {}
@@ -290,7 +558,7 @@ class ArtifactHandler(ABC):
                     header_key = key.upper().replace(' ', '_')
                     header_updates[header_key] = value
             
-            return self._header_manager.update_managed_header(content, header_updates)
+            return _header_manager().update_managed_header(content, header_updates)
             
         except Exception as e:
             logger.error(f"Error managing headers with ArtifactHeaderManager: {e}")
@@ -298,6 +566,34 @@ class ArtifactHandler(ABC):
             lines = content.split('\n')
             return '\n'.join(self._legacy_manage_header_metadata_lines(lines, updates))
     
+    def _fast_set_status_line(self, content: str, status: str) -> Optional[str]:
+        """Rewrite the status line in place for the common single-key update.
+
+        Handles the typical shape where the status line directly follows the
+        header line, in either managed (`Status`:) or legacy (Status:) form.
+
+        Args:
+            content: Full artifact content string
+            status: The new status value
+
+        Returns:
+            Updated content, or None if the content shape doesn't match and
+            the generic path should be used instead
+        """
+        nl = content.find('\n')
+        if nl == -1:
+            return None
+
+        for prefix in ('`Status`:', 'Status:'):
+            if content.startswith(prefix, nl + 1):
+                line_end = content.find('\n', nl + 1)
+                replacement = f"{prefix} {status}"
+                if line_end == -1:
+                    return content[:nl + 1] + replacement
+                return content[:nl + 1] + replacement + content[line_end:]
+
+        return None
+
     def _legacy_manage_header_metadata_lines(self, lines: List[str], updates: Dict[str, str]) -> List[str]:
         """Legacy metadata management (fallback method).
         
@@ -396,12 +692,11 @@ class ArtifactHandler(ABC):
             
             # Use the header manager to add the reference
             header_updates = {'REFERENCED_BY': ref_artifact_id}
-            updated_content = self._header_manager.update_managed_header(content, header_updates)
+            updated_content = _header_manager().update_managed_header(content, header_updates)
             
             # Write back the updated content
             file_path = artifact_result.get("file_path")
             if file_path:
-                from pathlib import Path
                 Path(file_path).write_text(updated_content, encoding='utf-8')
                 
                 return {
@@ -435,37 +730,41 @@ class TaskPRDHandler(ArtifactHandler):
             Dictionary with combined update results including file move
         """
         try:
+            # Fail-fast: skip index, content, and move work when nothing changes
+            if self._is_noop_status_update(artifact_id, status):
+                return {"success": True, "message": f"{artifact_id} already {status}; no-op"}
+
             # Step 1: Always update index first
             index_result = self.update_status_in_index(artifact_id, status)
-            
+
             # Step 2: Let subclass handle content-specific updates
             content_result = self.update_status_content(artifact_id, status, artifact_manager)
-            
+
             # Step 3: Handle file move if required by status
             move_result = self._move_file_for_status(artifact_id, status, artifact_manager)
-            
+
             # Step 4: Combine all results
             messages = []
             success = True
-            
+
             if index_result.get("success"):
                 messages.append(f"Index: {index_result.get('message')}")
             else:
                 messages.append(f"Index warning: {index_result.get('message')}")
-            
+
             if content_result.get("success"):
                 messages.append(f"Content: {content_result.get('message')}")
             else:
                 messages.append(f"Content error: {content_result.get('message')}")
                 success = False
-            
+
             if move_result.get("success"):
                 if "No file move required" not in move_result.get("message", ""):
                     messages.append(f"File move: {move_result.get('message')}")
             else:
                 messages.append(f"File move error: {move_result.get('message')}")
                 success = False
-            
+
             return {
                 "success": success,
                 "artifact_id": artifact_id,
@@ -475,13 +774,13 @@ class TaskPRDHandler(ArtifactHandler):
                 "content_result": content_result,
                 "move_result": move_result
             }
-            
+
         except Exception as e:
             return {
                 "success": False,
                 "message": f"Error updating {artifact_id}: {str(e)}"
             }
-    
+
     def finalize(self, artifact_id: str, id_mapping: Dict[str, str]) -> Dict[str, Any]:
         """Handle TASKPRD-specific post-finalization activities.
         
@@ -499,16 +798,14 @@ class TaskPRDHandler(ArtifactHandler):
         logger.info(f"TASKPRD handler called for {artifact_id}")
         logger.info(f"ID mapping received: {id_mapping}")
         
-        # Import ArtifactManager here to avoid circular imports
-        from .artifact_manager import get_artifact_id_manager
-        
         actions_performed = ["Post-processing hook executed"]
         errors = []
-        updated_reqs = []
-        
+        updated_reqs: set[str] = set()
+        req_to_tasks: Dict[str, List[str]] = {}
+
         try:
-            # Get artifact manager instance
-            artifact_manager = get_artifact_id_manager()
+            # Get the shared artifact manager instance
+            artifact_manager = _artifact_manager()
             
             # Update the main TASKPRD artifact status to NEW
             taskprd_status_result = self.update_status(artifact_id, "NEW", artifact_manager)
@@ -565,7 +862,7 @@ class TaskPRDHandler(ArtifactHandler):
                         prd_content = prd_result["content"]
                         
                         # Parse current PRD headers using header manager
-                        prd_header_line, prd_headers, prd_body = self._header_manager.parse_managed_headers(prd_content)
+                        prd_header_line, prd_headers, prd_body = _header_manager().parse_managed_headers(prd_content)
                         current_refs_str = prd_headers.get('REFERENCED_BY', '')
                         
                         # Parse current references from comma-separated string
@@ -584,10 +881,10 @@ class TaskPRDHandler(ArtifactHandler):
                             updated_prd_headers['REFERENCED_BY'] = ','.join(current_refs)
                             
                             # Get PRD artifact type for header ordering
-                            prd_type_info = self._header_manager.extract_artifact_type_and_id(prd_content)
+                            prd_type_info = _header_manager().extract_artifact_type_and_id(prd_content)
                             if prd_type_info:
                                 prd_type, _ = prd_type_info
-                                applicable_headers = self._header_manager.get_managed_headers_for_type(prd_type)
+                                applicable_headers = _header_manager().get_managed_headers_for_type(prd_type)
                                 
                                 # Rebuild PRD content with updated references
                                 result_lines = [prd_header_line]
@@ -608,7 +905,6 @@ class TaskPRDHandler(ArtifactHandler):
                                 # Write back updated PRD content
                                 prd_file_path = prd_result.get("file_path")
                                 if prd_file_path:
-                                    from pathlib import Path
                                     Path(prd_file_path).write_text(updated_prd_content, encoding='utf-8')
                                     actions_performed.append(f"Updated parent PRD {parent_prd_id} Referenced by to include {artifact_id}")
                                     logger.info(f"Successfully updated {parent_prd_id} Referenced by header")
@@ -641,7 +937,11 @@ class TaskPRDHandler(ArtifactHandler):
             
             logger.info(f"Processing {len(task_ids)} TASK artifacts")
             actions_performed.append(f"Found {len(task_ids)} TASK artifacts to process")
-            
+
+            # Index the TASKPRD once into {task_id: [req_ids]} instead of
+            # rescanning the full document for every TASK
+            task_req_index = self._index_task_implementations(taskprd_content)
+
             for task_id in task_ids:
                 try:
                     logger.info(f"Processing TASK artifact: {task_id}")
@@ -658,52 +958,47 @@ class TaskPRDHandler(ArtifactHandler):
                             logger.warning(error_msg)
                             errors.append(error_msg)
                     
-                    # Parse the TASKPRD content to find this specific TASK section
-                    task_section_content = self._extract_task_section(taskprd_content, task_id)
-                    
-                    if not task_section_content:
+                    # Look up this TASK's REQ implementations from the
+                    # single-pass index
+                    if task_id not in task_req_index:
                         logger.warning(f"Could not find section for {task_id} in TASKPRD")
                         continue
-                    
-                    # Parse the task section to find REQ implementations
-                    req_ids = self._extract_req_implementations(task_section_content)
-                    
+
+                    req_ids = task_req_index[task_id]
+
                     if not req_ids:
                         logger.info(f"No REQ implementations found in {task_id}")
                         continue
                     
                     logger.info(f"Found REQ implementations in {task_id}: {req_ids}")
                     actions_performed.append(f"{task_id} implements REQs: {', '.join(req_ids)}")
-                    
-                    # Update each REQ artifact to record this TASK as implementing it
+
+                    # Aggregate the mapping; REQ files are written once below
                     for req_id in req_ids:
-                        try:
-                            self._update_req_with_implementing_task(artifact_manager, req_id, task_id)
-                            updated_reqs.append(req_id)
-                            logger.info(f"Updated {req_id} to record implementation by {task_id}")
-                        except Exception as e:
-                            error_msg = f"Failed to update {req_id} for {task_id}: {str(e)}"
-                            logger.error(error_msg)
-                            errors.append(error_msg)
-                
+                        req_to_tasks.setdefault(req_id, []).append(task_id)
+
                 except Exception as e:
                     error_msg = f"Error processing TASK {task_id}: {str(e)}"
                     logger.error(error_msg)
                     errors.append(error_msg)
-            
-            # Summary of actions
-            unique_updated_reqs = list(set(updated_reqs))
-            if unique_updated_reqs:
-                actions_performed.append(f"Updated {len(unique_updated_reqs)} REQ artifacts: {', '.join(unique_updated_reqs)}")
-            
-            if errors:
-                actions_performed.append(f"Encountered {len(errors)} errors during processing")
-        
+
+            # Update each REQ once with the full set of implementing TASKs,
+            # instead of one read/rewrite cycle per (task, req) pair
+            self._apply_req_updates(artifact_manager, req_to_tasks, updated_reqs, errors)
+
         except Exception as e:
             error_msg = f"Critical error in TASKPRD handler: {str(e)}"
             logger.error(error_msg)
             errors.append(error_msg)
-        
+
+        # Summary of actions (sorted once, reused in the return payload)
+        unique_updated_reqs = sorted(updated_reqs)
+        if unique_updated_reqs:
+            actions_performed.append(f"Updated {len(unique_updated_reqs)} REQ artifacts: {', '.join(unique_updated_reqs)}")
+
+        if errors:
+            actions_performed.append(f"Encountered {len(errors)} errors during processing")
+
         return {
             "handler_type": "TASKPRD",
             "artifact_id": artifact_id,
@@ -711,10 +1006,104 @@ class TaskPRDHandler(ArtifactHandler):
             "status": "completed" if not errors else "completed_with_errors",
             "message": f"TASKPRD handler processed {artifact_id}",
             "actions_performed": actions_performed,
-            "updated_reqs": list(set(updated_reqs)) if updated_reqs else [],
+            "updated_reqs": unique_updated_reqs,
             "errors": errors if errors else None
         }
     
+    def _apply_req_updates(self, artifact_manager, req_to_tasks: Dict[str, List[str]],
+                           updated_reqs: set, errors: List[str]) -> None:
+        """Apply the aggregated implementing-task updates to each REQ.
+
+        The per-REQ updates are independent, IO-bound read/rewrite cycles,
+        so large batches are dispatched to a thread pool. Parallelism is
+        only applied across distinct parent PRDs: REQ sections are embedded
+        in their parent's file, and two REQs sharing a file must not
+        read-modify-write it concurrently.
+
+        Args:
+            artifact_manager: The ArtifactManager instance
+            req_to_tasks: Mapping of REQ IDs to their implementing TASK IDs
+            updated_reqs: Set collecting successfully updated REQ IDs
+            errors: List collecting error messages
+        """
+        if len(req_to_tasks) < _PARALLEL_REQ_UPDATE_THRESHOLD:
+            for req_id, implementing_task_ids in req_to_tasks.items():
+                self._apply_one_req_update(artifact_manager, req_id, implementing_task_ids, updated_reqs, errors)
+            return
+
+        # Group by parent PRD via one index read; anything unresolvable
+        # shares one group so possibly-colocated REQs stay serialized
+        parent_by_id: Dict[str, Optional[str]] = {}
+        try:
+            index_manager = self._get_index_manager()
+            parent_by_id = {
+                entry["artifact_id"].upper(): entry.get("parent")
+                for entry in index_manager.get_all_artifacts()
+            }
+        except Exception as e:
+            logger.warning(f"Could not read index for REQ update grouping: {e}")
+
+        groups: Dict[Optional[str], List[str]] = {}
+        for req_id in req_to_tasks:
+            groups.setdefault(parent_by_id.get(req_id.upper()), []).append(req_id)
+
+        def _run_group(req_ids: List[str]) -> None:
+            for req_id in req_ids:
+                self._apply_one_req_update(artifact_manager, req_id, req_to_tasks[req_id], updated_reqs, errors)
+
+        max_workers = min(8, os.cpu_count() or 1, len(groups))
+        if max_workers <= 1:
+            _run_group([req_id for req_ids in groups.values() for req_id in req_ids])
+            return
+
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_run_group, req_ids) for req_ids in groups.values()]
+            for future in as_completed(futures):
+                future.result()
+
+    def _apply_one_req_update(self, artifact_manager, req_id: str, implementing_task_ids: List[str],
+                              updated_reqs: set, errors: List[str]) -> None:
+        """Update a single REQ, recording the outcome in the shared collectors.
+
+        Args:
+            artifact_manager: The ArtifactManager instance
+            req_id: The REQ artifact ID to update
+            implementing_task_ids: The TASK IDs that implement this REQ
+            updated_reqs: Set collecting successfully updated REQ IDs
+            errors: List collecting error messages
+        """
+        try:
+            self._update_req_with_implementing_tasks(artifact_manager, req_id, implementing_task_ids)
+            # set.add / list.append are atomic under the GIL, so the shared
+            # collectors are safe to touch from worker threads
+            updated_reqs.add(req_id)
+            logger.info(f"Updated {req_id} to record implementation by {', '.join(implementing_task_ids)}")
+        except Exception as e:
+            error_msg = f"Failed to update {req_id} for {', '.join(implementing_task_ids)}: {str(e)}"
+            logger.error(error_msg)
+            errors.append(error_msg)
+
+    def _index_task_implementations(self, taskprd_content: str) -> Dict[str, List[str]]:
+        """Index the TASKPRD into {task_id: [req_ids]} in one regex sweep.
+
+        A single pass of _TASK_BLOCK_RE isolates each TASK section, and one
+        _IMPLEMENTS_LINE_RE search per section pulls its *Implements*: REQ
+        ids, replacing nested Python-level line loops with C-level scans.
+
+        Args:
+            taskprd_content: The full content of the TASKPRD artifact
+
+        Returns:
+            Dictionary mapping TASK IDs to the REQ IDs they implement
+        """
+        index: Dict[str, List[str]] = {}
+        for match in _TASK_BLOCK_RE.finditer(taskprd_content):
+            task_id = match.group(1)
+            implements = _IMPLEMENTS_LINE_RE.search(match.group(0))
+            index[task_id] = _REQ_ID_PATTERN.findall(implements.group(1)) if implements else []
+        return index
+
     def _extract_task_section(self, taskprd_content: str, task_id: str) -> str:
         """Extract the content of a specific TASK section from TASKPRD content.
         
@@ -725,231 +1114,228 @@ class TaskPRDHandler(ArtifactHandler):
         Returns:
             Content of the TASK section, or empty string if not found
         """
-        lines = taskprd_content.split('\n')
-        task_section_lines = []
-        in_task_section = False
-        
-        for line in lines:
-            # Check if this line starts a TASK section we're looking for
-            if line.strip().startswith(f'### {task_id}:'):
-                in_task_section = True
-                task_section_lines.append(line)
-                continue
-            
-            # Check if this line starts a different TASK section (end of our section)
-            if in_task_section and line.strip().startswith('### TASK-'):
-                break
-            
-            # Add lines to our section if we're currently in it
-            if in_task_section:
-                task_section_lines.append(line)
-        
-        return '\n'.join(task_section_lines)
-    
-    def _extract_req_implementations(self, task_content: str) -> list[str]:
-        """Extract REQ artifact IDs from a TASK's *Implements:* line.
-        
-        Args:
-            task_content: The content of the TASK artifact
-            
-        Returns:
-            List of REQ artifact IDs that this TASK implements
-        """
-        import re
-        
-        lines = task_content.split('\n')
-        req_ids = []
-        
-        for line in lines:
-            line = line.strip()
-            # Look for lines like "*Implements*: REQ-2, REQ-3"
-            if line.startswith('*Implements*:'):
-                # Extract everything after "*Implements*:"
-                implements_text = line[len('*Implements*:'):].strip()
-                
-                # Find all REQ-<number> patterns
-                req_pattern = r'\bREQ-(\d+)\b'
-                matches = re.findall(req_pattern, implements_text)
-                
-                # Convert matches back to full REQ IDs
-                for match in matches:
-                    req_ids.append(f"REQ-{match}")
-                
-                break  # Assume only one *Implements*: line per TASK
-        
-        return req_ids
-    
+        # Locate section boundaries with C-level substring searches instead of
+        # a Python-level loop that strips and checks every line
+        marker = f'### {task_id}:'
+        if taskprd_content.startswith(marker):
+            start = 0
+        else:
+            idx = taskprd_content.find(f'\n{marker}')
+            if idx == -1:
+                return ''
+            start = idx + 1
+
+        end = taskprd_content.find('\n### TASK-', start + 1)
+        if end == -1:
+            return taskprd_content[start:]
+        return taskprd_content[start:end]
+
     def _update_req_with_implementing_task(self, artifact_manager, req_id: str, task_id: str) -> None:
         """Update a REQ artifact to record which TASK implements it.
-        
+
         Args:
             artifact_manager: The ArtifactManager instance
             req_id: The REQ artifact ID to update
             task_id: The TASK artifact ID that implements this REQ
         """
+        self._update_req_with_implementing_tasks(artifact_manager, req_id, [task_id])
+
+    def _update_req_with_implementing_tasks(self, artifact_manager, req_id: str, task_ids: List[str]) -> None:
+        """Update a REQ artifact to record all TASKs that implement it.
+
+        Reads and rewrites the REQ once regardless of how many TASKs implement
+        it, rather than one read/parse/write cycle per (task, req) pair.
+
+        Args:
+            artifact_manager: The ArtifactManager instance
+            req_id: The REQ artifact ID to update
+            task_ids: The TASK artifact IDs that implement this REQ
+        """
         # Get the current REQ content
         req_result = artifact_manager.get_artifact(req_id)
-        
+
         if not req_result.get("success"):
             raise Exception(f"Failed to retrieve REQ {req_id}: {req_result.get('message')}")
-        
+
         req_content = req_result["content"]
-        
+
         # Check if this REQ already has an *Implementing Tasks* line
-        updated_content = self._add_or_update_implementing_task_line(req_content, task_id)
-        
-        # Debug logging
-        logger.info(f"Original REQ content for {req_id}:")
-        logger.info(repr(req_content))
-        logger.info(f"Updated REQ content for {req_id}:")
-        logger.info(repr(updated_content))
-        
-        # Update the REQ artifact with the new content
-        update_result = artifact_manager._update_non_file_artifact(req_id, updated_content)
-        
+        updated_content = self._add_or_update_implementing_task_line(req_content, task_ids)
+
+        # All tasks already recorded: skip the disk write and index update
+        if updated_content is req_content or updated_content == req_content:
+            logger.info(f"Implementing tasks already recorded for {req_id}; no-op")
+            return
+
+        # Full-content dumps are DEBUG-only: repr() on a multi-KB artifact
+        # allocates an escaped copy, which adds up in large batch finalizes
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Original REQ content for {req_id}: {req_content!r}")
+            logger.debug(f"Updated REQ content for {req_id}: {updated_content!r}")
+
+        # Update the REQ artifact with the new content; pass the file path the
+        # read already resolved so the write can skip the repository walk
+        update_result = artifact_manager._update_non_file_artifact(
+            req_id, updated_content, file_hint=req_result.get("file_path")
+        )
+
         if not update_result.get("success"):
             raise Exception(f"Failed to update REQ {req_id}: {update_result.get('message')}")
-    
-    def _add_or_update_implementing_task_line(self, req_content: str, task_id: str) -> str:
+
+    def _add_or_update_implementing_task_line(self, req_content: str, task_ids: List[str]) -> str:
         """Add or update the implementing tasks in REQ content using ArtifactHeaderManager.
-        
+
         Args:
             req_content: Current content of the REQ artifact
-            task_id: The TASK ID to add to the implementing tasks
-            
+            task_ids: The TASK IDs to merge into the implementing tasks
+
         Returns:
-            Updated REQ content with the implementing task recorded
+            Updated REQ content with the implementing tasks recorded
         """
         try:
-            # Parse current implementing tasks using header manager
-            header_line, current_headers, body_content = self._header_manager.parse_managed_headers(req_content)
+            # Parse current implementing tasks using the header manager; the
+            # fused parse also yields the applicable header config
+            header_line, current_headers, body_content, artifact_type, applicable_headers = \
+                _header_manager().parse_managed_headers_full(req_content)
             current_tasks_str = current_headers.get('IMPLEMENTING_TASKS', '')
-            
+
             # Parse current tasks from comma-separated string
             if current_tasks_str.strip():
                 current_tasks = [task.strip() for task in current_tasks_str.split(',')]
             else:
                 current_tasks = []
-            
-            # Add the new task if not already present (check without status)
-            task_found = False
-            for task in current_tasks:
-                clean_task = task.split(' (')[0].strip()
-                if clean_task == task_id:
-                    task_found = True
-                    break
-            
-            if not task_found:
-                current_tasks.append(task_id)
-            
-            # Sort for consistency
-            current_tasks.sort(key=lambda x: x.split(' (')[0])
+
+            # Add each new task if not already present (check without status)
+            existing_task_ids = {_strip_status(task) for task in current_tasks}
+            added_any = False
+            for task_id in task_ids:
+                if task_id not in existing_task_ids:
+                    current_tasks.append(task_id)
+                    existing_task_ids.add(task_id)
+                    added_any = True
+
+            # All tasks already recorded: return the original content
+            # unchanged so callers can skip the rewrite entirely
+            if not added_any:
+                return req_content
+
+            # Sort for consistency
+            current_tasks.sort(key=_strip_status)
             
             # Rebuild content manually to avoid header manager's append behavior
             if not header_line:
                 raise Exception("Could not parse REQ header")
-            
-            # Get artifact type for header ordering
-            artifact_info = self._header_manager.extract_artifact_type_and_id(req_content)
-            if not artifact_info:
-                raise Exception("Could not determine artifact type for REQ")
-            
-            artifact_type, _ = artifact_info
-            applicable_headers = self._header_manager.get_managed_headers_for_type(artifact_type)
-            
+
             # Update the IMPLEMENTING_TASKS in current headers
             updated_headers = current_headers.copy()
             if current_tasks:
                 updated_headers['IMPLEMENTING_TASKS'] = ','.join(current_tasks)
             elif 'IMPLEMENTING_TASKS' in updated_headers:
                 del updated_headers['IMPLEMENTING_TASKS']
-            
-            # Rebuild the content with proper header ordering
-            result_lines = [header_line]
-            
-            # Add managed headers in a consistent order (based on config order)
-            for item_key, item_config in applicable_headers.items():
-                if item_key in updated_headers:
-                    label = item_config['label']
-                    value = updated_headers[item_key]
-                    result_lines.append(f"`{label.rstrip(':')}`: {value}")
-            
-            # Add body content
+
+            # Rebuild the content with proper header ordering (based on
+            # config order), joining the managed block in a single pass
+            # with the precomputed label prefixes. An unparseable type
+            # falls back to REQ, the only type handled here
+            managed_block = '\n'.join(
+                prefix + updated_headers[item_key]
+                for item_key, prefix in _header_line_prefixes(artifact_type or "REQ")
+                if item_key in updated_headers
+            )
+
+            rebuilt = header_line
+            if managed_block:
+                rebuilt += '\n' + managed_block
             if body_content.strip():
-                result_lines.append(body_content)
-            
-            return '\n'.join(result_lines)
+                rebuilt += '\n' + body_content
+            return rebuilt
             
         except Exception as e:
             logger.error(f"Error updating implementing tasks with ArtifactHeaderManager: {e}")
             # Fallback to legacy method
-            return self._legacy_add_or_update_implementing_task_line(req_content, task_id)
+            for task_id in task_ids:
+                req_content = self._legacy_add_or_update_implementing_task_line(req_content, task_id)
+            return req_content
     
     def _legacy_add_or_update_implementing_task_line(self, req_content: str, task_id: str) -> str:
         """Legacy method for updating implementing tasks (fallback).
-        
-        This is the original implementation kept as fallback.
+
+        Walks the header block via str.find instead of splitting the whole
+        REQ into a line list; only the rare "no metadata" path still
+        materializes lines.
         """
-        lines = req_content.split('\n')
-        implementing_line_index = None
-        
-        # Look for existing *Implementing Tasks* line
-        for i, line in enumerate(lines):
-            if line.strip().startswith('*Implementing Tasks*:') or line.strip().startswith('*Implementing Task*:'):
-                implementing_line_index = i
+        length = len(req_content)
+        pos = 0
+        implementing_span = None
+        last_metadata_span = None
+        metadata_open = True
+
+        # Metadata lines only appear in the header block, so stop walking
+        # as soon as the body starts.
+        while pos <= length:
+            eol = req_content.find('\n', pos)
+            line_end = eol if eol != -1 else length
+            line_stripped = req_content[pos:line_end].strip()
+            if line_stripped.startswith('*Implementing Tasks*:') or line_stripped.startswith('*Implementing Task*:'):
+                implementing_span = (pos, line_end)
                 break
-        
-        if implementing_line_index is not None:
-            # Update existing line
-            current_line = lines[implementing_line_index].strip()
-            
+            if line_stripped.startswith('*'):
+                if ':' in line_stripped and metadata_open:
+                    last_metadata_span = (pos, line_end)
+                else:
+                    metadata_open = False
+            elif line_stripped and not line_stripped.startswith(('#', '`')):
+                break
+            if eol == -1:
+                break
+            pos = eol + 1
+
+        if implementing_span is not None:
+            # Update existing line in place via string splicing
+            start, end = implementing_span
+            current_line = req_content[start:end].strip()
+
             # Extract current task IDs
             if ':' in current_line:
                 current_tasks_text = current_line.split(':', 1)[1].strip()
                 current_tasks = [t.strip() for t in current_tasks_text.split(',') if t.strip()]
             else:
                 current_tasks = []
-            
+
             # Add new task if not already present
             if task_id not in current_tasks:
                 current_tasks.append(task_id)
-            
+
             # Sort for consistency
             current_tasks.sort()
-            
-            # Update the line with proper markdown formatting
+
+            # Rebuild the line with proper markdown formatting
             if len(current_tasks) == 1:
-                lines[implementing_line_index] = f"*Implementing Task*: {current_tasks[0]}  "
+                new_line = f"*Implementing Task*: {current_tasks[0]}  "
             else:
-                lines[implementing_line_index] = f"*Implementing Tasks*: {', '.join(current_tasks)}  "
-        
-        else:
-            # Find the last metadata line (line starting with *)
-            last_metadata_index = -1
-            for i, line in enumerate(lines):
-                line_stripped = line.strip()
-                if line_stripped.startswith('*') and ':' in line_stripped:
-                    last_metadata_index = i
-            
-            if last_metadata_index >= 0:
-                # Ensure the last metadata line has proper markdown line ending (two spaces)
-                if not lines[last_metadata_index].endswith('  '):
-                    lines[last_metadata_index] = lines[last_metadata_index].rstrip() + '  '
-                
-                # Insert after the last metadata line with proper markdown spacing
-                insert_index = last_metadata_index + 1
-                
-                # Add the implementing task line with proper markdown line ending
-                lines.insert(insert_index, f"*Implementing Task*: {task_id}  ")
-            else:
-                # If no metadata found, find the heading and insert after it
-                for i, line in enumerate(lines):
-                    if line.strip().startswith('###'):
-                        insert_index = i + 1
-                        new_line = f"*Implementing Task*: {task_id}"
-                        lines.insert(insert_index, new_line)
-                        break
-        
+                new_line = f"*Implementing Tasks*: {', '.join(current_tasks)}  "
+            return req_content[:start] + new_line + req_content[end:]
+
+        if last_metadata_span is not None:
+            # Insert after the last metadata line, ensuring it keeps a
+            # proper markdown line ending (two spaces)
+            start, end = last_metadata_span
+            metadata_line = req_content[start:end]
+            if not metadata_line.endswith('  '):
+                metadata_line = metadata_line.rstrip() + '  '
+            return (req_content[:start] + metadata_line + '\n'
+                    + f"*Implementing Task*: {task_id}  "
+                    + req_content[end:])
+
+        # If no metadata found, find the heading and insert after it
+        lines = req_content.split('\n')
+        for i, line in enumerate(lines):
+            if line.strip().startswith('###'):
+                insert_index = i + 1
+                new_line = f"*Implementing Task*: {task_id}"
+                lines = lines[:insert_index] + [new_line] + lines[insert_index:]
+                break
+
         return '\n'.join(lines)
     
     def update_status_content(self, artifact_id: str, status: str, artifact_manager) -> Dict[str, Any]:
@@ -985,9 +1371,8 @@ class TaskPRDHandler(ArtifactHandler):
             # Write back the updated content
             file_path = artifact_result.get("file_path")
             if file_path:
-                from pathlib import Path
-                Path(file_path).write_text(updated_content, encoding='utf-8')
-                
+                _atomic_write_text(Path(file_path), updated_content)
+
                 return {
                     "success": True,
                     "message": f"Updated TASKPRD {artifact_id} status to {status}",
@@ -1021,6 +1406,10 @@ class PRDHandler(ArtifactHandler):
             Dictionary with combined update results including file move
         """
         try:
+            # Fail-fast: skip index, content, and move work when nothing changes
+            if self._is_noop_status_update(artifact_id, status):
+                return {"success": True, "message": f"{artifact_id} already {status}; no-op"}
+
             # Step 1: Always update index first
             index_result = self.update_status_in_index(artifact_id, status)
             
@@ -1074,37 +1463,38 @@ class PRDHandler(ArtifactHandler):
 
         actions_performed: list[str] = ["Post-processing hook executed"]
         errors: list[str] = []
-        updated_reqs: list[str] = []
+        updated_reqs: set[str] = set()
 
         try:
-            # Get artifact manager instance (import locally to avoid circular imports)
-            from .artifact_manager import get_artifact_id_manager
-            artifact_manager = get_artifact_id_manager()
+            # Get the shared artifact manager instance
+            artifact_manager = _artifact_manager()
 
             # Update the main PRD artifact status
             logger.info(f"Updating status for PRD artifact: {artifact_id}")
 
-            # Update PRD status to NEW after finalization
-            # First update the index
-            index_result = self.update_status_in_index(artifact_id, "NEW")
-            if index_result.get("success"):
-                actions_performed.append(f"Updated {artifact_id} status to NEW in index")
-                logger.info(f"Successfully updated {artifact_id} status to NEW in index")
-            else:
-                error_msg = f"Failed to update {artifact_id} status in index: {index_result.get('message')}"
-                logger.error(error_msg)
-                errors.append(error_msg)
-
-            # Then update the artifact content (template method also updates index; kept for parity with existing behavior)
+            # Update PRD status to NEW after finalization. update_status
+            # already writes the index internally, so a separate
+            # update_status_in_index call here would rewrite it twice.
             status_result = self.update_status(artifact_id, "NEW", artifact_manager)
             if status_result.get("success"):
-                actions_performed.append(f"Updated {artifact_id} status to NEW in content")
-                logger.info(f"Successfully updated {artifact_id} status to NEW in content")
+                actions_performed.append(f"Updated {artifact_id} status to NEW")
+                logger.info(f"Successfully updated {artifact_id} status to NEW")
             else:
-                error_msg = f"Failed to update {artifact_id} status in content: {status_result.get('message')}"
+                error_msg = f"Failed to update {artifact_id} status: {status_result.get('message')}"
                 logger.error(error_msg)
                 errors.append(error_msg)
 
+            # Surface the nested index outcome for parity with the previous
+            # two-step reporting
+            index_result = status_result.get("index_result") or {}
+            if index_result:
+                if index_result.get("success"):
+                    actions_performed.append(f"Index: {index_result.get('message')}")
+                else:
+                    error_msg = f"Failed to update {artifact_id} status in index: {index_result.get('message')}"
+                    logger.error(error_msg)
+                    errors.append(error_msg)
+
             # After PRD is finalized, set all nested REQ artifacts to NEW
             try:
                 # Extract REQ artifact IDs from id_mapping
@@ -1123,7 +1513,7 @@ class PRDHandler(ArtifactHandler):
                             res = req_handler.update_status(req_id, "NEW", artifact_manager)
                             if res.get("success"):
                                 actions_performed.append(f"Updated {req_id} status to NEW")
-                                updated_reqs.append(req_id)
+                                updated_reqs.add(req_id)
                             else:
                                 msg = res.get("message", "Unknown error")
                                 error_msg = f"Failed to set {req_id} to NEW: {msg}"
@@ -1155,7 +1545,7 @@ class PRDHandler(ArtifactHandler):
             "status": "completed" if not errors else "completed_with_errors",
             "message": f"PRD handler processed {artifact_id}",
             "actions_performed": actions_performed,
-            "updated_reqs": list(sorted(set(updated_reqs))) if updated_reqs else [],
+            "updated_reqs": sorted(updated_reqs),
             "errors": errors if errors else None
         }
     
@@ -1187,9 +1577,8 @@ class PRDHandler(ArtifactHandler):
             # Write back the updated content
             file_path = artifact_result.get("file_path")
             if file_path:
-                from pathlib import Path
-                Path(file_path).write_text(updated_content, encoding='utf-8')
-                
+                _atomic_write_text(Path(file_path), updated_content)
+
                 return {
                     "success": True,
                     "message": f"Updated PRD {artifact_id} status to {status}",
@@ -1248,76 +1637,44 @@ class PRDHandler(ArtifactHandler):
             if not file_path:
                 return {"success": False, "message": f"No file path found for {parent_artifact_id}"}
 
-            lines = content.split('\n')
-
-            # Find or create '## Acceptance Tests' section
+            # Operate on the raw text directly; splitting into lines and
+            # rejoining is unnecessary since all edits are slice-based
             acc_header = "## Acceptance Tests"
-            has_section = any(l.strip() == acc_header for l in lines)
-            if not has_section:
+            match = _ACCEPTANCE_HEADER_RE.search(content)
+            if not match:
                 # Append header at end, but before any version footer
-                text = '\n'.join(lines)
-                import re
-                version_footer_match = re.search(r"<!--\s*ReSpecT\s+v[\d.]+\s*-->", text)
+                version_footer_match = _find_version_footer(content)
                 if version_footer_match:
                     # Insert before version footer
                     insert_pos = version_footer_match.start()
-                    left = text[:insert_pos].rstrip()
-                    right = text[insert_pos:]
+                    left = content[:insert_pos].rstrip()
+                    right = content[insert_pos:]
                     insertion = f"\n\n{acc_header}\n\n{new_artifact_content.strip()}\n"
                     new_text = left + insertion + right
                 else:
                     # No version footer, append at end like before
-                    if lines and lines[-1].strip() != "":
-                        lines.append("")
-                    lines.append(acc_header)
-                    lines.append("")
-                    base_text = '\n'.join(lines).rstrip() + "\n\n"
-                    new_text = base_text + new_artifact_content.strip() + "\n"
+                    new_text = content.rstrip() + f"\n\n{acc_header}\n\n" + new_artifact_content.strip() + "\n"
             else:
-                # Reconstruct full text to locate the end of Acceptance Tests section
-                text = '\n'.join(lines)
-                import re
-                header_pattern = re.compile(r"^\s*##\s+Acceptance Tests\s*$", re.MULTILINE)
-                match = header_pattern.search(text)
-                if not match:
-                    # Fallback: append header, but before version footer if present
-                    version_footer_match = re.search(r"<!--\s*ReSpecT\s+v[\d.]+\s*-->", text)
+                header_end = match.end()
+                # Find the next top-level '## ' header after Acceptance Tests
+                next_header_match = _NEXT_H2_RE.search(content[header_end:])
+                if next_header_match:
+                    insert_pos = header_end + next_header_match.start()
+                else:
+                    # Check for ReSpecT version footer and insert before it
+                    version_footer_match = _find_version_footer(content)
                     if version_footer_match:
                         insert_pos = version_footer_match.start()
-                        left = text[:insert_pos].rstrip()
-                        right = text[insert_pos:]
-                        insertion = f"\n\n{acc_header}\n\n{new_artifact_content.strip()}\n"
-                        new_text = left + insertion + right
                     else:
-                        # No version footer, append at end
-                        if lines and lines[-1].strip() != "":
-                            lines.append("")
-                        lines.append(acc_header)
-                        lines.append("")
-                        base_text = '\n'.join(lines).rstrip() + "\n\n"
-                        new_text = base_text + new_artifact_content.strip() + "\n"
-                else:
-                    header_end = match.end()
-                    # Find the next top-level '## ' header after Acceptance Tests
-                    next_header_match = re.search(r"^\s*##\s+", text[header_end:], re.MULTILINE)
-                    if next_header_match:
-                        insert_pos = header_end + next_header_match.start()
-                    else:
-                        # Check for ReSpecT version footer and insert before it
-                        version_footer_match = re.search(r"<!--\s*ReSpecT\s+v[\d.]+\s*-->", text)
-                        if version_footer_match:
-                            insert_pos = version_footer_match.start()
-                        else:
-                            insert_pos = len(text)
-                    # Build new text inserting at the end of the Acceptance Tests section
-                    left = text[:insert_pos].rstrip()
-                    right = text[insert_pos:].lstrip('\n') if insert_pos < len(text) else ""
-                    insertion = "\n\n" + new_artifact_content.strip() + "\n"
-                    new_text = left + insertion + right
+                        insert_pos = len(content)
+                # Build new content inserting at the end of the Acceptance Tests section
+                left = content[:insert_pos].rstrip()
+                right = content[insert_pos:].lstrip('\n') if insert_pos < len(content) else ""
+                insertion = "\n\n" + new_artifact_content.strip() + "\n"
+                new_text = left + insertion + right
 
             # Write PRD file back
-            from pathlib import Path as _Path
-            _Path(file_path).write_text(new_text, encoding='utf-8')
+            Path(file_path).write_text(new_text, encoding='utf-8')
 
             return {
                 "success": True,
@@ -1347,8 +1704,16 @@ class REQHandler(ArtifactHandler):
             
             # Use the header manager to update the status
             header_updates = {'STATUS': status}
-            updated_content = self._header_manager.update_managed_header(req_content, header_updates)
-            
+            updated_content = _header_manager().update_managed_header(req_content, header_updates)
+
+            # Skip the rewrite when the status was already set; the rebuilt
+            # content is unchanged in that case
+            if updated_content == req_content:
+                return {
+                    "success": True,
+                    "message": f"REQ {artifact_id} status already {status}; content unchanged"
+                }
+
             # Update the REQ artifact with the new content
             update_result = artifact_manager._update_non_file_artifact(artifact_id, updated_content)
             
@@ -1385,42 +1750,28 @@ class TASKHandler(ArtifactHandler):
         Returns:
             Dictionary with success status and message
         """
-        import re
-        
         try:
             # Get the current TASK content
             task_result = artifact_manager.get_artifact(artifact_id)
-            
+
             if not task_result.get("success"):
                 return {
                     "success": False,
                     "message": f"Failed to retrieve TASK {artifact_id}: {task_result.get('message')}"
                 }
-            
+
             task_content = task_result["content"]
-            lines = task_content.split('\n')
-            
-            # Find the step line to mark as done
+
+            # Find the step line and flip its checkbox in place
             # Pattern: [ ] X.Y description  ->  [x] X.Y description
-            step_pattern = re.compile(r'^(\[ \]) (' + re.escape(step_number) + r') (.+)$')
-            updated = False
-            
-            for i, line in enumerate(lines):
-                match = step_pattern.match(line)
-                if match:
-                    # Replace [ ] with [x] while preserving the rest of the line
-                    lines[i] = f"[x] {match.group(2)} {match.group(3)}"
-                    updated = True
-                    break
-            
-            if not updated:
+            updated_content = _mark_step_done_in_content(task_content, step_number)
+
+            if updated_content is None:
                 return {
                     "success": False,
                     "message": f"Step {step_number} not found in TASK {artifact_id} or already marked as done"
                 }
-            
-            updated_content = '\n'.join(lines)
-            
+
             # Update the TASK artifact with the new content
             update_result = artifact_manager._update_non_file_artifact(artifact_id, updated_content)
             
@@ -1461,32 +1812,41 @@ class TASKHandler(ArtifactHandler):
             
             # Use the header manager to update the status
             header_updates = {'STATUS': status}
-            updated_content = self._header_manager.update_managed_header(task_content, header_updates)
-            
-            # Update the TASK artifact with the new content
-            update_result = artifact_manager._update_non_file_artifact(artifact_id, updated_content)
-            
-            if not update_result.get("success"):
-                return {
-                    "success": False,
-                    "message": f"Failed to update TASK {artifact_id}: {update_result.get('message')}"
-                }
+            updated_content = _header_manager().update_managed_header(task_content, header_updates)
+
+            if updated_content != task_content:
+                # Update the TASK artifact with the new content
+                update_result = artifact_manager._update_non_file_artifact(artifact_id, updated_content)
+
+                if not update_result.get("success"):
+                    return {
+                        "success": False,
+                        "message": f"Failed to update TASK {artifact_id}: {update_result.get('message')}"
+                    }
+                file_path = update_result.get("file_path")
+            else:
+                # Status already set: skip the rewrite. The REQ propagation
+                # below still runs and no-ops the same way per REQ
+                file_path = None
             
             # Now update all REQ artifacts that this TASK implements
             req_update_messages = []
             try:
                 req_ids = self._extract_req_implementations(task_content)
                 logger.info(f"TASK {artifact_id} implements REQs: {req_ids}")
-                
-                for req_id in req_ids:
-                    try:
-                        self._update_req_implementing_task_status(artifact_manager, req_id, artifact_id, status)
-                        req_update_messages.append(f"Updated {req_id} to show {artifact_id} status as {status}")
-                        logger.info(f"Updated {req_id} implementing task status for {artifact_id}")
-                    except Exception as e:
-                        error_msg = f"Failed to update {req_id} for {artifact_id}: {str(e)}"
-                        logger.error(error_msg)
-                        req_update_messages.append(f"Error: {error_msg}")
+
+                # Batch the per-REQ rewrites so each containing file is
+                # written once instead of once per REQ
+                with artifact_manager.batch_updates():
+                    for req_id in req_ids:
+                        try:
+                            self._update_req_implementing_task_status(artifact_manager, req_id, artifact_id, status)
+                            req_update_messages.append(f"Updated {req_id} to show {artifact_id} status as {status}")
+                            logger.info(f"Updated {req_id} implementing task status for {artifact_id}")
+                        except Exception as e:
+                            error_msg = f"Failed to update {req_id} for {artifact_id}: {str(e)}"
+                            logger.error(error_msg)
+                            req_update_messages.append(f"Error: {error_msg}")
             except Exception as e:
                 logger.error(f"Error processing REQ updates for {artifact_id}: {str(e)}")
                 req_update_messages.append(f"Error processing REQ updates: {str(e)}")
@@ -1501,7 +1861,7 @@ class TASKHandler(ArtifactHandler):
             return {
                 "success": True,
                 "message": combined_message,
-                "file_path": update_result.get("file_path")
+                "file_path": file_path
             }
             
         except Exception as e:
@@ -1519,29 +1879,14 @@ class TASKHandler(ArtifactHandler):
         Returns:
             List of REQ artifact IDs that this TASK implements
         """
-        import re
-        
-        lines = task_content.split('\n')
-        req_ids = []
-        
-        for line in lines:
-            line = line.strip()
-            # Look for lines like "*Implements*: REQ-2, REQ-3"
-            if line.startswith('*Implements*:'):
-                # Extract everything after "*Implements*:"
-                implements_text = line[len('*Implements*:'):].strip()
-                
-                # Find all REQ-<number> patterns
-                req_pattern = r'\bREQ-(\d+)\b'
-                matches = re.findall(req_pattern, implements_text)
-                
-                # Convert matches back to full REQ IDs
-                for match in matches:
-                    req_ids.append(f"REQ-{match}")
-                
-                break  # Assume only one *Implements*: line per TASK
-        
-        return req_ids
+        # Find the first "*Implements*: REQ-2, REQ-3" line in one anchored
+        # regex pass instead of splitting and scanning every line
+        match = _IMPLEMENTS_LINE_RE.search(task_content)
+        if not match:
+            return []
+
+        # Find all REQ-<number> patterns (matches are already full IDs)
+        return _REQ_ID_PATTERN.findall(match.group(1))
     
     def _update_req_implementing_task_status(self, artifact_manager, req_id: str, task_id: str, status: str) -> None:
         """Update a REQ artifact to show the status of an implementing TASK.
@@ -1562,43 +1907,56 @@ class TASKHandler(ArtifactHandler):
             raise Exception(f"Failed to retrieve REQ {req_id}: {req_result.get('message')}")
         
         req_content = req_result["content"]
-        
-        # Parse current implementing tasks using header manager
-        header_line, current_headers, body_content = self._header_manager.parse_managed_headers(req_content)
+
+        # Parse the REQ once; the fused parse also yields the artifact type
+        # and header config needed for the rebuild below
+        header_line, current_headers, body_content, artifact_type, applicable_headers = \
+            _header_manager().parse_managed_headers_full(req_content)
+        if not artifact_type:
+            raise Exception(f"Could not determine artifact type for REQ {req_id}")
+
         current_tasks_str = current_headers.get('IMPLEMENTING_TASKS', '')
-        
-        # Parse current tasks from comma-separated string
-        if current_tasks_str.strip():
-            current_tasks = [task.strip() for task in current_tasks_str.split(',')]
+        new_entry = f"{task_id} ({status})"
+
+        # Fast path for the common shapes: no tasks yet, or a single entry
+        # for this very task. Both resolve to the new entry without building
+        # the task list at all
+        stripped_tasks_str = current_tasks_str.strip()
+        if not stripped_tasks_str or (',' not in stripped_tasks_str
+                                      and _strip_status(stripped_tasks_str) == task_id):
+            updated_tasks_str = new_entry
         else:
-            current_tasks = []
-        
-        # Update the task list to include status for this task
-        updated_tasks = []
-        task_found = False
-        
-        for task in current_tasks:
-            # Remove any existing status from task string
-            clean_task = task.split(' (')[0].strip()
-            if clean_task == task_id:
-                # Replace this task with the new status
-                updated_tasks.append(f"{task_id} ({status})")
-                task_found = True
-            else:
-                # Keep other tasks as they were
-                updated_tasks.append(task)
-        
-        # If task wasn't found in the list, add it
-        if not task_found:
-            updated_tasks.append(f"{task_id} ({status})")
-        
-        # Convert back to comma-separated string and replace the entire list
-        updated_tasks_str = ','.join(updated_tasks) if updated_tasks else ''
-        
-        # For list types, we need to replace the entire value, not append
-        # So we'll build the updated content manually to avoid the header manager's append logic
-        header_line, current_headers, body_content = self._header_manager.parse_managed_headers(req_content)
-        
+            current_tasks = [task.strip() for task in stripped_tasks_str.split(',')]
+
+            # Update the task list to include status for this task
+            updated_tasks = []
+            task_found = False
+
+            for task in current_tasks:
+                # Compare without any existing status suffix
+                if _strip_status(task) == task_id:
+                    # Replace this task with the new status
+                    updated_tasks.append(new_entry)
+                    task_found = True
+                else:
+                    # Keep other tasks as they were
+                    updated_tasks.append(task)
+
+            # If task wasn't found in the list, add it
+            if not task_found:
+                updated_tasks.append(new_entry)
+
+            # Convert back to comma-separated string and replace the entire
+            # list. For list types the entire value is replaced, not
+            # appended, so the updated content is built manually below
+            updated_tasks_str = ','.join(updated_tasks)
+
+        # Nothing to do when the entry already shows this status; skip the
+        # rebuild and the file write entirely
+        if updated_tasks_str == current_tasks_str:
+            logger.info(f"REQ {req_id} already shows {task_id} ({status}); skipping rewrite")
+            return
+
         # Update the IMPLEMENTING_TASKS header directly
         updated_headers = current_headers.copy()
         if updated_tasks_str:
@@ -1606,25 +1964,14 @@ class TASKHandler(ArtifactHandler):
         elif 'IMPLEMENTING_TASKS' in updated_headers:
             # Remove the header if no tasks remain
             del updated_headers['IMPLEMENTING_TASKS']
-        
-        # Get artifact type for header ordering
-        artifact_info = self._header_manager.extract_artifact_type_and_id(req_content)
-        if not artifact_info:
-            raise Exception(f"Could not determine artifact type for REQ {req_id}")
-        
-        artifact_type, _ = artifact_info
-        applicable_headers = self._header_manager.get_managed_headers_for_type(artifact_type)
-        
-        # Rebuild the content with proper header ordering
+
+        # Rebuild the content with proper header ordering (based on config
+        # order), using the precomputed label prefixes
         result_lines = [header_line]
-        
-        # Add managed headers in a consistent order (based on config order)
-        for item_key, item_config in applicable_headers.items():
+        for item_key, prefix in _header_line_prefixes(artifact_type):
             if item_key in updated_headers:
-                label = item_config['label']
-                value = updated_headers[item_key]
-                result_lines.append(f"`{label.rstrip(':')}`: {value}")
-        
+                result_lines.append(prefix + updated_headers[item_key])
+
         # Add body content
         if body_content.strip():
             result_lines.append(body_content)
@@ -1655,42 +2002,28 @@ class UACCHandler(ArtifactHandler):
         Returns:
             Dictionary with success status and message
         """
-        import re
-        
         try:
             # Get the current UACC content
             uacc_result = artifact_manager.get_artifact(artifact_id)
-            
+
             if not uacc_result.get("success"):
                 return {
                     "success": False,
                     "message": f"Failed to retrieve UACC {artifact_id}: {uacc_result.get('message')}"
                 }
-            
+
             uacc_content = uacc_result["content"]
-            lines = uacc_content.split('\n')
-            
-            # Find the step line to mark as done
+
+            # Find the step line and flip its checkbox in place
             # Pattern: [ ] X.Y description  ->  [x] X.Y description
-            step_pattern = re.compile(r'^(\[ \]) (' + re.escape(step_number) + r') (.+)$')
-            updated = False
-            
-            for i, line in enumerate(lines):
-                match = step_pattern.match(line)
-                if match:
-                    # Replace [ ] with [x] while preserving the rest of the line
-                    lines[i] = f"[x] {match.group(2)} {match.group(3)}"
-                    updated = True
-                    break
-            
-            if not updated:
+            updated_content = _mark_step_done_in_content(uacc_content, step_number)
+
+            if updated_content is None:
                 return {
                     "success": False,
                     "message": f"Step {step_number} not found in UACC {artifact_id} or already marked as done"
                 }
-            
-            updated_content = '\n'.join(lines)
-            
+
             # Update the UACC artifact with the new content
             update_result = artifact_manager._update_non_file_artifact(artifact_id, updated_content)
             
@@ -1724,14 +2057,23 @@ class UACCHandler(ArtifactHandler):
             Dictionary with combined update results including covering test updates
         """
         try:
+            # Fail-fast: a no-op status skips the index rewrite, the content
+            # rewrite, and the covering-tests fan-out entirely
+            if self._is_noop_status_update(artifact_id, status):
+                return {"success": True, "message": f"{artifact_id} already {status}; no-op"}
+
             # Step 1: Always update index first
             index_result = self.update_status_in_index(artifact_id, status)
-            
-            # Step 2: Update content using the existing method
-            content_result = self.update_status_content(artifact_id, status, artifact_manager)
-            
-            # Step 3: Update covering tests in REQ artifacts
-            covering_test_result = self._update_covering_tests(artifact_id, status, artifact_manager)
+
+            # Steps 2-3 share one read-through cache: the artifact and REQ
+            # contents loaded by either step are served from memory instead
+            # of re-reading and re-walking the repository per step
+            with artifact_manager.batch_updates():
+                # Step 2: Update content using the existing method
+                content_result = self.update_status_content(artifact_id, status, artifact_manager)
+
+                # Step 3: Update covering tests in REQ artifacts
+                covering_test_result = self._update_covering_tests(artifact_id, status, artifact_manager)
             
             # Step 4: Combine all results
             messages = []
@@ -1783,74 +2125,25 @@ class UACCHandler(ArtifactHandler):
             Dictionary with update results
         """
         try:
-            from .artifact_index_manager import get_artifact_index_manager
-            
             updated_reqs = []
             errors = []
-            
-            # Get index manager to search for REQ artifacts
-            index_manager = get_artifact_index_manager()
-            
-            # Search for all REQ artifacts
-            all_artifacts = index_manager.get_all_artifacts()
-            req_artifacts = [artifact for artifact in all_artifacts 
-                           if artifact.get("artifact_id", "").startswith("REQ-")]
-            
-            for req_entry in req_artifacts:
-                req_id = req_entry.get("artifact_id")
-                if not req_id:
-                    continue
-                
-                try:
-                    # Get REQ content
-                    req_result = artifact_manager.get_artifact(req_id)
-                    if not req_result.get("success"):
-                        continue
-                    
-                    req_content = req_result["content"]
-                    
-                    # Parse REQ headers to check covering tests
-                    req_header_line, req_headers, req_body = self._header_manager.parse_managed_headers(req_content)
-                    covering_tests_str = req_headers.get('COVERING_TESTS', '')
-                    
-                    if not covering_tests_str or artifact_id not in covering_tests_str:
-                        continue  # This REQ doesn't reference our artifact
-                    
-                    # Update the status notation for our artifact in the covering tests
-                    updated_covering_tests = self._update_test_status_in_list(covering_tests_str, artifact_id, status)
-                    
-                    if updated_covering_tests != covering_tests_str:
-                        # Update REQ with new covering tests
-                        updated_req_headers = req_headers.copy()
-                        updated_req_headers['COVERING_TESTS'] = updated_covering_tests
-                        
-                        # Rebuild REQ content
-                        req_type_info = self._header_manager.extract_artifact_type_and_id(req_content)
-                        if req_type_info:
-                            req_type, _ = req_type_info
-                            applicable_headers = self._header_manager.get_managed_headers_for_type(req_type)
-                            
-                            result_lines = [req_header_line]
-                            for item_key, item_config in applicable_headers.items():
-                                if item_key in updated_req_headers:
-                                    label = item_config['label']
-                                    value = updated_req_headers[item_key]
-                                    result_lines.append(f"`{label.rstrip(':')}`: {value}")
-                            
-                            if req_body.strip():
-                                result_lines.append(req_body)
-                            
-                            updated_req_content = '\n'.join(result_lines)
-                            
-                            # Save updated REQ
-                            update_result = artifact_manager.update_artifact(req_id, updated_req_content)
-                            if update_result.get("success"):
-                                updated_reqs.append(req_id)
-                            else:
-                                errors.append(f"Failed to update {req_id}: {update_result.get('message')}")
-                
-                except Exception as e:
-                    errors.append(f"Error processing {req_id}: {str(e)}")
+
+            # Only visit REQs known to reference this artifact, via the
+            # lazily built reverse index, instead of rescanning every REQ
+            referencing_reqs = sorted(_covering_tests_index(artifact_manager).get(artifact_id, ()))
+
+            # All REQs share one artifact type, so resolve the header line
+            # prefixes once instead of re-deriving them per matching REQ
+            header_prefixes = _header_line_prefixes("REQ")
+
+            # Batch the per-REQ rewrites so each containing file is written
+            # once instead of once per REQ, and prefetch every REQ in one
+            # repository pass instead of one walk per REQ
+            with artifact_manager.batch_updates():
+                req_results = artifact_manager.get_artifacts_bulk(referencing_reqs)
+                self._apply_covering_test_updates(
+                    artifact_id, status, artifact_manager, header_prefixes,
+                    referencing_reqs, req_results, updated_reqs, errors)
             
             if updated_reqs:
                 message = f"Updated covering tests in {len(updated_reqs)} REQ artifacts: {', '.join(updated_reqs)}"
@@ -1870,6 +2163,145 @@ class UACCHandler(ArtifactHandler):
                 "message": f"Error updating covering tests: {str(e)}"
             }
     
+    def _apply_covering_test_updates(self, artifact_id: str, status: str, artifact_manager,
+                                     header_prefixes: tuple, referencing_reqs: List[str],
+                                     req_results: Dict[str, Dict[str, Any]], updated_reqs: List[str],
+                                     errors: List[str]) -> None:
+        """Run the per-REQ covering-test updates, in parallel for large sets.
+
+        The per-REQ updates are independent, IO-bound read/rewrite cycles,
+        so large batches are dispatched to a thread pool. Parallelism only
+        spans distinct parent PRDs: sibling REQ sections share their
+        parent's file and must not read-modify-write it concurrently.
+
+        Args:
+            artifact_id: The test artifact ID being updated
+            status: The new status
+            artifact_manager: The ArtifactManager instance
+            header_prefixes: Precomputed header line prefixes for the REQ type
+            referencing_reqs: REQ IDs whose covering tests mention the artifact
+            req_results: Prefetched get_artifact results keyed by REQ ID
+            updated_reqs: List collecting successfully updated REQ IDs
+            errors: List collecting error messages
+        """
+        if len(referencing_reqs) < _PARALLEL_REQ_UPDATE_THRESHOLD:
+            for req_id in referencing_reqs:
+                self._update_covering_test_in_req(req_id, artifact_id, status, artifact_manager,
+                                                  header_prefixes, req_results, updated_reqs, errors)
+            return
+
+        # Group by parent PRD via one index read; anything unresolvable
+        # shares one group so possibly-colocated REQs stay serialized
+        parent_by_id: Dict[str, Optional[str]] = {}
+        try:
+            index_manager = self._get_index_manager()
+            parent_by_id = {
+                entry["artifact_id"].upper(): entry.get("parent")
+                for entry in index_manager.get_all_artifacts()
+            }
+        except Exception as e:
+            logger.warning(f"Could not read index for covering-test grouping: {e}")
+
+        groups: Dict[Optional[str], List[str]] = {}
+        for req_id in referencing_reqs:
+            groups.setdefault(parent_by_id.get(req_id.upper()), []).append(req_id)
+
+        def _run_group(req_ids: List[str]) -> None:
+            for req_id in req_ids:
+                self._update_covering_test_in_req(req_id, artifact_id, status, artifact_manager,
+                                                  header_prefixes, req_results, updated_reqs, errors)
+
+        max_workers = min(8, os.cpu_count() or 1, len(groups))
+        if max_workers <= 1:
+            _run_group([req_id for req_ids in groups.values() for req_id in req_ids])
+            return
+
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_run_group, req_ids) for req_ids in groups.values()]
+            for future in as_completed(futures):
+                future.result()
+
+    def _update_covering_test_in_req(self, req_id: str, artifact_id: str, status: str, artifact_manager,
+                                     header_prefixes: tuple, req_results: Dict[str, Dict[str, Any]],
+                                     updated_reqs: List[str], errors: List[str]) -> None:
+        """Update the covering-tests entry in one REQ, recording the outcome.
+
+        Appends to the shared collectors are atomic under the GIL, so the
+        parallel dispatch path needs no extra locking.
+
+        Args:
+            req_id: The REQ artifact ID to update
+            artifact_id: The test artifact ID being updated
+            status: The new status
+            artifact_manager: The ArtifactManager instance
+            header_prefixes: Precomputed header line prefixes for the REQ type
+            req_results: Prefetched get_artifact results keyed by REQ ID
+            updated_reqs: List collecting successfully updated REQ IDs
+            errors: List collecting error messages
+        """
+        try:
+            # Get the prefetched REQ content
+            req_result = req_results.get(req_id) or {}
+            if not req_result.get("success"):
+                return
+
+            req_content = req_result["content"]
+
+            # Cheap raw-content check before paying for the header
+            # parse; most REQs won't reference this artifact
+            if artifact_id not in req_content:
+                return
+
+            # Parse REQ headers to check covering tests
+            req_header_line, req_headers, req_body = _header_manager().parse_managed_headers(req_content)
+            covering_tests_str = req_headers.get('COVERING_TESTS', '')
+
+            if not covering_tests_str or artifact_id not in covering_tests_str:
+                return  # This REQ doesn't reference our artifact
+
+            # Update the status notation for our artifact in the covering tests
+            updated_covering_tests = self._update_test_status_in_list(covering_tests_str, artifact_id, status)
+
+            if updated_covering_tests != covering_tests_str:
+                # Fast path: only the covering-tests value changed, so
+                # splice it into the existing header line in place
+                covering_prefix = dict(header_prefixes).get('COVERING_TESTS', '`Covering Tests`: ')
+                old_line = covering_prefix + covering_tests_str
+                line_start = req_content.find(old_line)
+                if line_start != -1:
+                    line_end = line_start + len(old_line)
+                    updated_req_content = (req_content[:line_start]
+                                           + covering_prefix + updated_covering_tests
+                                           + req_content[line_end:])
+                else:
+                    # Line not found verbatim (unusual spacing): fall back
+                    # to the full header rebuild. A populated COVERING_TESTS
+                    # header means the type already parsed as REQ, so the
+                    # hoisted prefixes apply
+                    updated_req_headers = req_headers.copy()
+                    updated_req_headers['COVERING_TESTS'] = updated_covering_tests
+
+                    result_lines = [req_header_line]
+                    for item_key, prefix in header_prefixes:
+                        if item_key in updated_req_headers:
+                            result_lines.append(prefix + updated_req_headers[item_key])
+
+                    if req_body.strip():
+                        result_lines.append(req_body)
+
+                    updated_req_content = '\n'.join(result_lines)
+
+                # Save updated REQ
+                update_result = artifact_manager.update_artifact(req_id, updated_req_content)
+                if update_result.get("success"):
+                    updated_reqs.append(req_id)
+                else:
+                    errors.append(f"Failed to update {req_id}: {update_result.get('message')}")
+
+        except Exception as e:
+            errors.append(f"Error processing {req_id}: {str(e)}")
+
     def _update_test_status_in_list(self, covering_tests_str: str, artifact_id: str, status: str) -> str:
         """Update status notation for a specific artifact in a covering tests list.
         
@@ -1881,24 +2313,11 @@ class UACCHandler(ArtifactHandler):
         Returns:
             Updated covering tests string
         """
-        import re
-        
-        # Split by comma and process each test
-        tests = [test.strip() for test in covering_tests_str.split(',')]
-        updated_tests = []
-        
-        for test in tests:
-            if test.startswith(artifact_id):
-                # Update or add status notation
-                # Pattern: UACC-17 (OLD_STATUS) -> UACC-17 (NEW_STATUS)
-                # Or: UACC-17 -> UACC-17 (NEW_STATUS)
-                test_without_status = re.sub(r'\s*\([^)]*\)$', '', test)
-                updated_test = f"{test_without_status} ({status})"
-                updated_tests.append(updated_test)
-            else:
-                updated_tests.append(test)
-        
-        return ','.join(updated_tests)
+        # Replace the entry and its optional '(STATUS)' suffix in a single
+        # C-level regex pass instead of a split/rebuild loop
+        return _covering_test_entry_re(artifact_id).sub(
+            lambda _m: f"{artifact_id} ({status})", covering_tests_str, count=1
+        )
     
     def update_status_content(self, artifact_id: str, status: str, artifact_manager) -> Dict[str, Any]:
         """Update status for UACC artifact using ArtifactHeaderManager."""
@@ -1916,8 +2335,16 @@ class UACCHandler(ArtifactHandler):
             
             # Use the header manager to update the status
             header_updates = {'STATUS': status}
-            updated_content = self._header_manager.update_managed_header(uacc_content, header_updates)
-            
+            updated_content = _header_manager().update_managed_header(uacc_content, header_updates)
+
+            # Skip the rewrite when the status was already set; the rebuilt
+            # content is unchanged in that case
+            if updated_content == uacc_content:
+                return {
+                    "success": True,
+                    "message": f"UACC {artifact_id} status already {status}; content unchanged"
+                }
+
             # Update the UACC artifact with the new content
             update_result = artifact_manager._update_non_file_artifact(artifact_id, updated_content)
             
@@ -1954,42 +2381,28 @@ class SACCHandler(ArtifactHandler):
         Returns:
             Dictionary with success status and message
         """
-        import re
-        
         try:
             # Get the current SACC content
             sacc_result = artifact_manager.get_artifact(artifact_id)
-            
+
             if not sacc_result.get("success"):
                 return {
                     "success": False,
                     "message": f"Failed to retrieve SACC {artifact_id}: {sacc_result.get('message')}"
                 }
-            
+
             sacc_content = sacc_result["content"]
-            lines = sacc_content.split('\n')
-            
-            # Find the step line to mark as done
+
+            # Find the step line and flip its checkbox in place
             # Pattern: [ ] X.Y description  ->  [x] X.Y description
-            step_pattern = re.compile(r'^(\[ \]) (' + re.escape(step_number) + r') (.+)$')
-            updated = False
-            
-            for i, line in enumerate(lines):
-                match = step_pattern.match(line)
-                if match:
-                    # Replace [ ] with [x] while preserving the rest of the line
-                    lines[i] = f"[x] {match.group(2)} {match.group(3)}"
-                    updated = True
-                    break
-            
-            if not updated:
+            updated_content = _mark_step_done_in_content(sacc_content, step_number)
+
+            if updated_content is None:
                 return {
                     "success": False,
                     "message": f"Step {step_number} not found in SACC {artifact_id} or already marked as done"
                 }
-            
-            updated_content = '\n'.join(lines)
-            
+
             # Update the SACC artifact with the new content
             update_result = artifact_manager._update_non_file_artifact(artifact_id, updated_content)
             
@@ -2027,8 +2440,16 @@ class SACCHandler(ArtifactHandler):
             
             # Use the header manager to update the status
             header_updates = {'STATUS': status}
-            updated_content = self._header_manager.update_managed_header(sacc_content, header_updates)
-            
+            updated_content = _header_manager().update_managed_header(sacc_content, header_updates)
+
+            # Skip the rewrite when the status was already set; the rebuilt
+            # content is unchanged in that case
+            if updated_content == sacc_content:
+                return {
+                    "success": True,
+                    "message": f"SACC {artifact_id} status already {status}; content unchanged"
+                }
+
             # Update the SACC artifact with the new content
             update_result = artifact_manager._update_non_file_artifact(artifact_id, updated_content)
             
@@ -2062,14 +2483,23 @@ class SACCHandler(ArtifactHandler):
             Dictionary with combined update results including covering test updates
         """
         try:
+            # Fail-fast: a no-op status skips the index rewrite, the content
+            # rewrite, and the covering-tests fan-out entirely
+            if self._is_noop_status_update(artifact_id, status):
+                return {"success": True, "message": f"{artifact_id} already {status}; no-op"}
+
             # Step 1: Always update index first
             index_result = self.update_status_in_index(artifact_id, status)
-            
-            # Step 2: Update content using the existing method
-            content_result = self.update_status_content(artifact_id, status, artifact_manager)
-            
-            # Step 3: Update covering tests in REQ artifacts
-            covering_test_result = self._update_covering_tests(artifact_id, status, artifact_manager)
+
+            # Steps 2-3 share one read-through cache: the artifact and REQ
+            # contents loaded by either step are served from memory instead
+            # of re-reading and re-walking the repository per step
+            with artifact_manager.batch_updates():
+                # Step 2: Update content using the existing method
+                content_result = self.update_status_content(artifact_id, status, artifact_manager)
+
+                # Step 3: Update covering tests in REQ artifacts
+                covering_test_result = self._update_covering_tests(artifact_id, status, artifact_manager)
             
             # Step 4: Combine all results
             messages = []
@@ -2121,74 +2551,25 @@ class SACCHandler(ArtifactHandler):
             Dictionary with update results
         """
         try:
-            from .artifact_index_manager import get_artifact_index_manager
-            
             updated_reqs = []
             errors = []
-            
-            # Get index manager to search for REQ artifacts
-            index_manager = get_artifact_index_manager()
-            
-            # Search for all REQ artifacts
-            all_artifacts = index_manager.get_all_artifacts()
-            req_artifacts = [artifact for artifact in all_artifacts 
-                           if artifact.get("artifact_id", "").startswith("REQ-")]
-            
-            for req_entry in req_artifacts:
-                req_id = req_entry.get("artifact_id")
-                if not req_id:
-                    continue
-                
-                try:
-                    # Get REQ content
-                    req_result = artifact_manager.get_artifact(req_id)
-                    if not req_result.get("success"):
-                        continue
-                    
-                    req_content = req_result["content"]
-                    
-                    # Parse REQ headers to check covering tests
-                    req_header_line, req_headers, req_body = self._header_manager.parse_managed_headers(req_content)
-                    covering_tests_str = req_headers.get('COVERING_TESTS', '')
-                    
-                    if not covering_tests_str or artifact_id not in covering_tests_str:
-                        continue  # This REQ doesn't reference our artifact
-                    
-                    # Update the status notation for our artifact in the covering tests
-                    updated_covering_tests = self._update_test_status_in_list(covering_tests_str, artifact_id, status)
-                    
-                    if updated_covering_tests != covering_tests_str:
-                        # Update REQ with new covering tests
-                        updated_req_headers = req_headers.copy()
-                        updated_req_headers['COVERING_TESTS'] = updated_covering_tests
-                        
-                        # Rebuild REQ content
-                        req_type_info = self._header_manager.extract_artifact_type_and_id(req_content)
-                        if req_type_info:
-                            req_type, _ = req_type_info
-                            applicable_headers = self._header_manager.get_managed_headers_for_type(req_type)
-                            
-                            result_lines = [req_header_line]
-                            for item_key, item_config in applicable_headers.items():
-                                if item_key in updated_req_headers:
-                                    label = item_config['label']
-                                    value = updated_req_headers[item_key]
-                                    result_lines.append(f"`{label.rstrip(':')}`: {value}")
-                            
-                            if req_body.strip():
-                                result_lines.append(req_body)
-                            
-                            updated_req_content = '\n'.join(result_lines)
-                            
-                            # Save updated REQ
-                            update_result = artifact_manager.update_artifact(req_id, updated_req_content)
-                            if update_result.get("success"):
-                                updated_reqs.append(req_id)
-                            else:
-                                errors.append(f"Failed to update {req_id}: {update_result.get('message')}")
-                
-                except Exception as e:
-                    errors.append(f"Error processing {req_id}: {str(e)}")
+
+            # Only visit REQs known to reference this artifact, via the
+            # lazily built reverse index, instead of rescanning every REQ
+            referencing_reqs = sorted(_covering_tests_index(artifact_manager).get(artifact_id, ()))
+
+            # All REQs share one artifact type, so resolve the header line
+            # prefixes once instead of re-deriving them per matching REQ
+            header_prefixes = _header_line_prefixes("REQ")
+
+            # Batch the per-REQ rewrites so each containing file is written
+            # once instead of once per REQ, and prefetch every REQ in one
+            # repository pass instead of one walk per REQ
+            with artifact_manager.batch_updates():
+                req_results = artifact_manager.get_artifacts_bulk(referencing_reqs)
+                self._apply_covering_test_updates(
+                    artifact_id, status, artifact_manager, header_prefixes,
+                    referencing_reqs, req_results, updated_reqs, errors)
             
             if updated_reqs:
                 message = f"Updated covering tests in {len(updated_reqs)} REQ artifacts: {', '.join(updated_reqs)}"
@@ -2208,6 +2589,145 @@ class SACCHandler(ArtifactHandler):
                 "message": f"Error updating covering tests: {str(e)}"
             }
     
+    def _apply_covering_test_updates(self, artifact_id: str, status: str, artifact_manager,
+                                     header_prefixes: tuple, referencing_reqs: List[str],
+                                     req_results: Dict[str, Dict[str, Any]], updated_reqs: List[str],
+                                     errors: List[str]) -> None:
+        """Run the per-REQ covering-test updates, in parallel for large sets.
+
+        The per-REQ updates are independent, IO-bound read/rewrite cycles,
+        so large batches are dispatched to a thread pool. Parallelism only
+        spans distinct parent PRDs: sibling REQ sections share their
+        parent's file and must not read-modify-write it concurrently.
+
+        Args:
+            artifact_id: The test artifact ID being updated
+            status: The new status
+            artifact_manager: The ArtifactManager instance
+            header_prefixes: Precomputed header line prefixes for the REQ type
+            referencing_reqs: REQ IDs whose covering tests mention the artifact
+            req_results: Prefetched get_artifact results keyed by REQ ID
+            updated_reqs: List collecting successfully updated REQ IDs
+            errors: List collecting error messages
+        """
+        if len(referencing_reqs) < _PARALLEL_REQ_UPDATE_THRESHOLD:
+            for req_id in referencing_reqs:
+                self._update_covering_test_in_req(req_id, artifact_id, status, artifact_manager,
+                                                  header_prefixes, req_results, updated_reqs, errors)
+            return
+
+        # Group by parent PRD via one index read; anything unresolvable
+        # shares one group so possibly-colocated REQs stay serialized
+        parent_by_id: Dict[str, Optional[str]] = {}
+        try:
+            index_manager = self._get_index_manager()
+            parent_by_id = {
+                entry["artifact_id"].upper(): entry.get("parent")
+                for entry in index_manager.get_all_artifacts()
+            }
+        except Exception as e:
+            logger.warning(f"Could not read index for covering-test grouping: {e}")
+
+        groups: Dict[Optional[str], List[str]] = {}
+        for req_id in referencing_reqs:
+            groups.setdefault(parent_by_id.get(req_id.upper()), []).append(req_id)
+
+        def _run_group(req_ids: List[str]) -> None:
+            for req_id in req_ids:
+                self._update_covering_test_in_req(req_id, artifact_id, status, artifact_manager,
+                                                  header_prefixes, req_results, updated_reqs, errors)
+
+        max_workers = min(8, os.cpu_count() or 1, len(groups))
+        if max_workers <= 1:
+            _run_group([req_id for req_ids in groups.values() for req_id in req_ids])
+            return
+
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_run_group, req_ids) for req_ids in groups.values()]
+            for future in as_completed(futures):
+                future.result()
+
+    def _update_covering_test_in_req(self, req_id: str, artifact_id: str, status: str, artifact_manager,
+                                     header_prefixes: tuple, req_results: Dict[str, Dict[str, Any]],
+                                     updated_reqs: List[str], errors: List[str]) -> None:
+        """Update the covering-tests entry in one REQ, recording the outcome.
+
+        Appends to the shared collectors are atomic under the GIL, so the
+        parallel dispatch path needs no extra locking.
+
+        Args:
+            req_id: The REQ artifact ID to update
+            artifact_id: The test artifact ID being updated
+            status: The new status
+            artifact_manager: The ArtifactManager instance
+            header_prefixes: Precomputed header line prefixes for the REQ type
+            req_results: Prefetched get_artifact results keyed by REQ ID
+            updated_reqs: List collecting successfully updated REQ IDs
+            errors: List collecting error messages
+        """
+        try:
+            # Get the prefetched REQ content
+            req_result = req_results.get(req_id) or {}
+            if not req_result.get("success"):
+                return
+
+            req_content = req_result["content"]
+
+            # Cheap raw-content check before paying for the header
+            # parse; most REQs won't reference this artifact
+            if artifact_id not in req_content:
+                return
+
+            # Parse REQ headers to check covering tests
+            req_header_line, req_headers, req_body = _header_manager().parse_managed_headers(req_content)
+            covering_tests_str = req_headers.get('COVERING_TESTS', '')
+
+            if not covering_tests_str or artifact_id not in covering_tests_str:
+                return  # This REQ doesn't reference our artifact
+
+            # Update the status notation for our artifact in the covering tests
+            updated_covering_tests = self._update_test_status_in_list(covering_tests_str, artifact_id, status)
+
+            if updated_covering_tests != covering_tests_str:
+                # Fast path: only the covering-tests value changed, so
+                # splice it into the existing header line in place
+                covering_prefix = dict(header_prefixes).get('COVERING_TESTS', '`Covering Tests`: ')
+                old_line = covering_prefix + covering_tests_str
+                line_start = req_content.find(old_line)
+                if line_start != -1:
+                    line_end = line_start + len(old_line)
+                    updated_req_content = (req_content[:line_start]
+                                           + covering_prefix + updated_covering_tests
+                                           + req_content[line_end:])
+                else:
+                    # Line not found verbatim (unusual spacing): fall back
+                    # to the full header rebuild. A populated COVERING_TESTS
+                    # header means the type already parsed as REQ, so the
+                    # hoisted prefixes apply
+                    updated_req_headers = req_headers.copy()
+                    updated_req_headers['COVERING_TESTS'] = updated_covering_tests
+
+                    result_lines = [req_header_line]
+                    for item_key, prefix in header_prefixes:
+                        if item_key in updated_req_headers:
+                            result_lines.append(prefix + updated_req_headers[item_key])
+
+                    if req_body.strip():
+                        result_lines.append(req_body)
+
+                    updated_req_content = '\n'.join(result_lines)
+
+                # Save updated REQ
+                update_result = artifact_manager.update_artifact(req_id, updated_req_content)
+                if update_result.get("success"):
+                    updated_reqs.append(req_id)
+                else:
+                    errors.append(f"Failed to update {req_id}: {update_result.get('message')}")
+
+        except Exception as e:
+            errors.append(f"Error processing {req_id}: {str(e)}")
+
     def _update_test_status_in_list(self, covering_tests_str: str, artifact_id: str, status: str) -> str:
         """Update status notation for a specific artifact in a covering tests list.
         
@@ -2219,24 +2739,11 @@ class SACCHandler(ArtifactHandler):
         Returns:
             Updated covering tests string
         """
-        import re
-        
-        # Split by comma and process each test
-        tests = [test.strip() for test in covering_tests_str.split(',')]
-        updated_tests = []
-        
-        for test in tests:
-            if test.startswith(artifact_id):
-                # Update or add status notation
-                # Pattern: SACC-18 (OLD_STATUS) -> SACC-18 (NEW_STATUS)
-                # Or: SACC-18 -> SACC-18 (NEW_STATUS)
-                test_without_status = re.sub(r'\s*\([^)]*\)$', '', test)
-                updated_test = f"{test_without_status} ({status})"
-                updated_tests.append(updated_test)
-            else:
-                updated_tests.append(test)
-        
-        return ','.join(updated_tests)
+        # Replace the entry and its optional '(STATUS)' suffix in a single
+        # C-level regex pass instead of a split/rebuild loop
+        return _covering_test_entry_re(artifact_id).sub(
+            lambda _m: f"{artifact_id} ({status})", covering_tests_str, count=1
+        )
 
 
 class ArtifactHandlerFactory:
@@ -2251,21 +2758,29 @@ class ArtifactHandlerFactory:
         "SACC": SACCHandler,
         # Future handlers can be added here
     }
-    
+
+    # Handlers are stateless (all per-call state travels through method
+    # arguments), so one instance per type serves every caller
+    _instances: Dict[str, ArtifactHandler] = {}
+
     @classmethod
     def get_handler(cls, artifact_type: str) -> Optional[ArtifactHandler]:
-        """Get a handler for the specified artifact type.
-        
+        """Get the shared handler for the specified artifact type.
+
         Args:
             artifact_type: The artifact type (e.g., "TASKPRD", "PRD")
-            
+
         Returns:
             Handler instance if available, None otherwise
         """
-        handler_class = cls._handlers.get(artifact_type.upper())
-        if handler_class:
-            return handler_class()
-        return None
+        key = artifact_type.upper()
+        handler = cls._instances.get(key)
+        if handler is None:
+            handler_class = cls._handlers.get(key)
+            if not handler_class:
+                return None
+            handler = cls._instances.setdefault(key, handler_class())
+        return handler
     
     @classmethod
     def has_handler(cls, artifact_type: str) -> bool:
@@ -8,11 +8,23 @@ import json
 import os
 import re
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Set, Any
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple, Set, Any
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Fields every artifact-type definition must declare
+_REQUIRED_FIELDS = frozenset({'name', 'description', 'template_name'})
+
+try:
+    # orjson is optional; its JSONDecodeError subclasses the stdlib's, so
+    # the existing except clauses work with either parser
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 class ArtifactTypeManager:
     """Manages artifact type definitions and naming patterns."""
@@ -24,8 +36,7 @@ class ArtifactTypeManager:
         Returns:
             True if can_tool_update is set to true for this type, else False
         """
-        artifact_type = artifact_type.upper()
-        info = self.get_artifact_type_info(artifact_type)
+        info = self._get_artifact_type_info_ref(artifact_type)
         return bool(info.get("can_tool_update", False))
     
     def has_capability(self, artifact_type: str, capability: str) -> bool:
@@ -36,8 +47,7 @@ class ArtifactTypeManager:
         Returns:
             True if the capability is set to true for this type, else False
         """
-        artifact_type = artifact_type.upper()
-        info = self.get_artifact_type_info(artifact_type)
+        info = self._get_artifact_type_info_ref(artifact_type)
         return bool(info.get(capability, False))
     
     def __init__(self, config_path: Optional[str] = None):
@@ -60,9 +70,32 @@ class ArtifactTypeManager:
         self.status_config_path = self.config_path.parent / "artifact_statuses.json"
         
         self._config = self._load_config()
-        self._status_config = self._load_status_config()
+        # Immutable views of the type table for hot validation paths
+        self._valid_types_tuple = tuple(self._config['artifact_types'].keys())
+        self._valid_types_set = frozenset(self._valid_types_tuple)
+        # Read-only views handed out by get_artifact_type_info; immutable,
+        # so no per-call defensive copy is needed
+        self._types_readonly = {
+            k: MappingProxyType(v) for k, v in self._config['artifact_types'].items()
+        }
+        # Status config is loaded lazily on first status API call; many
+        # callers (e.g. template lookups) never touch statuses at all
+        self._status_config_cache: Optional[Dict] = None
+        # Per-type status lookups resolve to the same answer for the life
+        # of the process, so cache them after the first computation
+        self._type_statuses_cache: Dict[str, Tuple[str, ...]] = {}
+        self._type_statuses_set_cache: Dict[str, frozenset] = {}
+
+        # Precompile ID patterns once; the valid-type set is fixed after load
+        self._provisional_text_re = re.compile(
+            r'\b(' + '|'.join(re.escape(t) for t in self._valid_types_tuple) + r')-PROVISIONAL\d+\b',
+            re.IGNORECASE
+        )
+        self._artifact_id_re = re.compile(r'^([A-Z]+)-(\d+)$')
+        self._provisional_id_re = re.compile(r'^([A-Z]+)-PROVISIONAL(\d+)$')
+        self._provisional_filename_re = re.compile(r'^([A-Z]+)-PROVISIONAL\d*$')
+
         logger.info(f"Initialized ArtifactTypeManager with config: {self.config_path}")
-        logger.info(f"Loaded status config: {self.status_config_path}")
         
     def _load_config(self) -> Dict:
         """Load the artifact types configuration from JSON file.
@@ -74,19 +107,17 @@ class ArtifactTypeManager:
             ValueError: If the config file is invalid JSON or missing required fields
         """
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-            
+            config = _json_loads(self.config_path.read_bytes())
+
             # Validate required top-level keys
             if 'artifact_types' not in config:
                 raise ValueError("Config file missing required 'artifact_types' section")
             
             # Validate each artifact type has required fields
             for artifact_type, definition in config['artifact_types'].items():
-                required_fields = ['name', 'description', 'template_name']
-                for field in required_fields:
-                    if field not in definition:
-                        raise ValueError(f"Artifact type '{artifact_type}' missing required field: {field}")
+                missing = _REQUIRED_FIELDS - definition.keys()
+                if missing:
+                    raise ValueError(f"Artifact type '{artifact_type}' missing required fields: {sorted(missing)}")
             
             logger.info(f"Successfully loaded {len(config['artifact_types'])} artifact types")
             return config
@@ -96,6 +127,13 @@ class ArtifactTypeManager:
         except Exception as e:
             raise ValueError(f"Error loading artifact types configuration: {e}")
     
+    @property
+    def _status_config(self) -> Dict:
+        """The status configuration, loaded from disk on first access."""
+        if self._status_config_cache is None:
+            self._status_config_cache = self._load_status_config()
+        return self._status_config_cache
+
     def _load_status_config(self) -> Dict:
         """Load the artifact status configuration from JSON file.
         
@@ -119,13 +157,15 @@ class ArtifactTypeManager:
                         "ARCHIVED": {"name": "Archived", "description": "Archived for historical reference"}
                     }
                 }
-                with open(self.status_config_path, 'w', encoding='utf-8') as f:
-                    json.dump(default_statuses, f, indent=2)
+                # Write via temp file + atomic rename so a crash mid-write
+                # can't leave a torn file that breaks later startups
+                tmp_path = self.status_config_path.with_suffix('.json.tmp')
+                tmp_path.write_text(json.dumps(default_statuses, indent=2), encoding='utf-8')
+                os.replace(tmp_path, self.status_config_path)
                 logger.info(f"Created default status config at {self.status_config_path}")
             
-            with open(self.status_config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-            
+            config = _json_loads(self.status_config_path.read_bytes())
+
             # Validate required top-level keys
             if 'statuses' not in config:
                 raise ValueError("Status config file missing required 'statuses' section")
@@ -144,7 +184,7 @@ class ArtifactTypeManager:
         Returns:
             List of valid artifact type codes (e.g., ['PRD', 'TASKPRD', 'REQ','TASK'])
         """
-        return list(self._config['artifact_types'].keys())
+        return list(self._valid_types_tuple)
     
     def is_valid_artifact_type(self, artifact_type: str) -> bool:
         """Check if an artifact type is valid.
@@ -155,26 +195,64 @@ class ArtifactTypeManager:
         Returns:
             True if the artifact type is valid, False otherwise
         """
-        return artifact_type.upper() in self._config['artifact_types']
+        return artifact_type.upper() in self._valid_types_set
     
-    def get_artifact_type_info(self, artifact_type: str) -> Dict:
+    def _get_artifact_type_info_ref(self, artifact_type: str) -> Dict:
+        """Get the config dict for an artifact type without copying it.
+
+        Internal read-only accessor for hot validation paths; callers must
+        not mutate the returned dict. Use get_artifact_type_info for a
+        safe-to-modify copy.
+
+        Args:
+            artifact_type: The artifact type to get info for
+
+        Returns:
+            The live configuration dictionary for this artifact type
+
+        Raises:
+            ValueError: If the artifact type is not valid
+        """
+        artifact_type = artifact_type.upper()
+        if not self.is_valid_artifact_type(artifact_type):
+            valid_types = self.get_valid_artifact_types()
+            raise ValueError(f"Invalid artifact type '{artifact_type}'. Valid types: {valid_types}")
+
+        return self._config['artifact_types'][artifact_type]
+
+    def get_artifact_type_info(self, artifact_type: str) -> Mapping:
         """Get detailed information about an artifact type.
         
         Args:
             artifact_type: The artifact type to get info for
             
         Returns:
-            Dictionary containing name, description, file_pattern, and template_name
+            Read-only mapping containing name, description, file_pattern, and
+            template_name. Use get_artifact_type_info_copy for a mutable dict.
             
         Raises:
             ValueError: If the artifact type is not valid
         """
         artifact_type = artifact_type.upper()
-        if not self.is_valid_artifact_type(artifact_type):
-            valid_types = self.get_valid_artifact_types()
+        if artifact_type not in self._valid_types_set:
+            valid_types = list(self._valid_types_tuple)
             raise ValueError(f"Invalid artifact type '{artifact_type}'. Valid types: {valid_types}")
+
+        return self._types_readonly[artifact_type]
+
+    def get_artifact_type_info_copy(self, artifact_type: str) -> Dict:
+        """Get a mutable copy of the configuration for an artifact type.
         
-        return self._config['artifact_types'][artifact_type].copy()
+        Args:
+            artifact_type: The artifact type to get info for
+            
+        Returns:
+            Dictionary copy that is safe for the caller to modify
+            
+        Raises:
+            ValueError: If the artifact type is not valid
+        """
+        return dict(self._get_artifact_type_info_ref(artifact_type))
     
     def get_template_name(self, artifact_type: str) -> str:
         """Get the template name for an artifact type.
@@ -188,7 +266,7 @@ class ArtifactTypeManager:
         Raises:
             ValueError: If the artifact type is not valid
         """
-        info = self.get_artifact_type_info(artifact_type)
+        info = self._get_artifact_type_info_ref(artifact_type)
         return info['template_name']
 
     def get_header_format(self, artifact_type: str) -> Optional[str]:
@@ -203,7 +281,7 @@ class ArtifactTypeManager:
         Raises:
             ValueError: If the artifact type is not valid
         """
-        info = self.get_artifact_type_info(artifact_type)
+        info = self._get_artifact_type_info_ref(artifact_type)
         return info.get('header_format')
 
     def get_artifact_type_from_id(self, artifact_id: str) -> str:
@@ -218,14 +296,21 @@ class ArtifactTypeManager:
         Raises:
             ValueError: If the ID format is invalid or type is unknown
         """
-        import re as _re
-        if not artifact_id or not isinstance(artifact_id, str):
+        if not artifact_id:
+            raise ValueError("artifact_id must be a non-empty string")
+        try:
+            match = self._artifact_id_re.match(artifact_id.upper())
+        except AttributeError:
+            # Non-string input; the common str path skips an isinstance check
             raise ValueError("artifact_id must be a non-empty string")
-        match = _re.match(r"^([A-Z]+)-\d+$", artifact_id.upper())
         if not match:
             raise ValueError(f"Invalid artifact ID format: {artifact_id}")
         artifact_type = match.group(1)
-        return self.validate_and_normalize_artifact_type(artifact_type)
+        # Already uppercase from the match; validate membership directly
+        # instead of re-normalizing through validate_and_normalize_artifact_type
+        if artifact_type not in self._valid_types_set:
+            raise ValueError(f"Invalid artifact type '{artifact_type}'. Valid types: {list(self._valid_types_tuple)}")
+        return artifact_type
     
     def validate_and_normalize_artifact_type(self, artifact_type: str) -> str:
         """Validate and normalize an artifact type string.
@@ -239,24 +324,25 @@ class ArtifactTypeManager:
         Raises:
             ValueError: If the artifact type is not valid
         """
-        if not artifact_type or not artifact_type.strip():
+        stripped = artifact_type.strip() if artifact_type else ""
+        if not stripped:
             raise ValueError("Artifact type cannot be empty")
-        
-        normalized = artifact_type.strip().upper()
-        
-        if not self.is_valid_artifact_type(normalized):
-            valid_types = self.get_valid_artifact_types()
+
+        normalized = stripped.upper()
+
+        if normalized not in self._valid_types_set:
+            valid_types = list(self._valid_types_tuple)
             raise ValueError(f"Invalid artifact type '{artifact_type}'. Valid types: {valid_types}")
         
         return normalized
     
-    def get_all_artifact_types_info(self) -> Dict[str, Dict]:
+    def get_all_artifact_types_info(self) -> Dict[str, Mapping]:
         """Get information about all configured artifact types.
         
         Returns:
-            Dictionary mapping artifact type codes to their info dictionaries
+            Dictionary mapping artifact type codes to read-only info mappings
         """
-        return {k: v.copy() for k, v in self._config['artifact_types'].items()}
+        return dict(self._types_readonly)
     
     def find_provisional_artifact_ids(self, text: str) -> Set[str]:
         """Find all provisional artifact IDs in the given text.
@@ -267,17 +353,11 @@ class ArtifactTypeManager:
         Returns:
             Set of provisional artifact IDs found in the text
         """
-        provisional_ids = set()
-        valid_types = self.get_valid_artifact_types()
-        
-        # Create pattern for any valid artifact type followed by -PROVISIONAL and digits
-        pattern = r'\b(' + '|'.join(re.escape(t) for t in valid_types) + r')-PROVISIONAL\d+\b'
-        
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        for match in re.finditer(pattern, text, re.IGNORECASE):
-            provisional_ids.add(match.group(0).upper())
-        
-        return provisional_ids
+        # One pass with the precompiled pattern covers every valid type
+        return {
+            match.group(0).upper()
+            for match in self._provisional_text_re.finditer(text)
+        }
     
     def parse_provisional_id(self, provisional_id: str) -> Tuple[str, int]:
         """Parse a provisional artifact ID into its components.
@@ -291,9 +371,8 @@ class ArtifactTypeManager:
         Raises:
             ValueError: If the provisional ID format is invalid
         """
-        pattern = r'^([A-Z]+)-PROVISIONAL(\d+)$'
-        match = re.match(pattern, provisional_id.upper())
-        
+        match = self._provisional_id_re.match(provisional_id.upper())
+
         if not match:
             raise ValueError(f"Invalid provisional ID format: {provisional_id}")
         
@@ -326,14 +405,19 @@ class ArtifactTypeManager:
             Falls back to global statuses if type-specific ones aren't defined
         """
         artifact_type = artifact_type.upper()
-        type_info = self.get_artifact_type_info(artifact_type)
-        
-        # Check if type has specific valid_statuses defined
-        if 'valid_statuses' in type_info:
-            return type_info['valid_statuses']
-        
-        # Fall back to global statuses
-        return self.get_valid_statuses()
+        cached = self._type_statuses_cache.get(artifact_type)
+        if cached is None:
+            type_info = self._get_artifact_type_info_ref(artifact_type)
+
+            # Type-specific valid_statuses win; fall back to global statuses
+            if 'valid_statuses' in type_info:
+                cached = tuple(type_info['valid_statuses'])
+            else:
+                cached = tuple(self.get_valid_statuses())
+            self._type_statuses_cache[artifact_type] = cached
+
+        # Copy so callers can't mutate shared state
+        return list(cached)
     
     def is_valid_status(self, status: str) -> bool:
         """Check if a status is valid.
@@ -356,8 +440,12 @@ class ArtifactTypeManager:
         Returns:
             True if the status is valid for this artifact type, False otherwise
         """
-        valid_statuses = self.get_valid_statuses_for_type(artifact_type)
-        return status.upper() in valid_statuses
+        artifact_type = artifact_type.upper()
+        valid_set = self._type_statuses_set_cache.get(artifact_type)
+        if valid_set is None:
+            valid_set = frozenset(self.get_valid_statuses_for_type(artifact_type))
+            self._type_statuses_set_cache[artifact_type] = valid_set
+        return status.upper() in valid_set
     
     def get_status_info(self, status: str) -> Dict:
         """Get detailed information about a status.
@@ -457,32 +545,37 @@ class ArtifactTypeManager:
         }
         
         try:
-            # Basic validation
-            if not artifact_id or not isinstance(artifact_id, str):
+            # Basic validation; assume str input and treat non-strings as
+            # the exceptional path
+            if not artifact_id:
+                result["error"] = "Artifact ID must be a non-empty string"
+                return result
+            try:
+                artifact_id = artifact_id.strip()
+            except AttributeError:
                 result["error"] = "Artifact ID must be a non-empty string"
                 return result
-            
-            artifact_id = artifact_id.strip()
             if not artifact_id:
                 result["error"] = "Artifact ID cannot be empty or whitespace"
                 return result
             
             # Check basic format: TYPE-NUMBER
-            match = re.match(r"^([A-Z]+)-(\d+)$", artifact_id.upper())
+            match = self._artifact_id_re.match(artifact_id.upper())
             if not match:
                 result["error"] = f"Invalid artifact ID format. Expected format: TYPE-NUMBER (e.g., PRD-1, TASKPRD-12)"
                 
                 # Provide suggestions based on common patterns
                 suggestions = []
-                valid_types = self.get_valid_artifact_types()
-                
+                valid_types = self._valid_types_tuple
+                artifact_id_upper = artifact_id.upper()
+
                 # Check if it's just a type without number
-                if artifact_id.upper() in valid_types:
-                    suggestions.append(f"Did you mean '{artifact_id.upper()}-1'?")
+                if artifact_id_upper in self._valid_types_set:
+                    suggestions.append(f"Did you mean '{artifact_id_upper}-1'?")
                 
                 # Check if it's close to a valid type
                 for valid_type in valid_types:
-                    if artifact_id.upper().startswith(valid_type):
+                    if artifact_id_upper.startswith(valid_type):
                         suggestions.append(f"Did you mean '{valid_type}-1'?")
                 
                 if not suggestions:
@@ -496,8 +589,8 @@ class ArtifactTypeManager:
             number = int(match.group(2))
             
             # Validate artifact type
-            if not self.is_valid_artifact_type(artifact_type):
-                valid_types = self.get_valid_artifact_types()
+            if artifact_type not in self._valid_types_set:
+                valid_types = self._valid_types_tuple
                 result["error"] = f"Invalid artifact type '{artifact_type}'. Valid types: {', '.join(valid_types)}"
                 
                 # Suggest closest match
@@ -576,8 +669,6 @@ class ArtifactTypeManager:
             >>> manager.validate_provisional_filename("TASKPRD-PROVISIONAL1.md")
             '{"valid": true, "artifact_type": "TASKPRD", "filename": "TASKPRD-PROVISIONAL1.md"}'
         """
-        import json
-        
         result = {
             "valid": False,
             "artifact_type": None,
@@ -587,13 +678,10 @@ class ArtifactTypeManager:
         
         try:
             # Remove file extension if present
-            name_without_ext = filename
-            if filename.endswith('.md'):
-                name_without_ext = filename[:-3]
-            
+            name_without_ext = filename.removesuffix('.md')
+
             # Pattern: ARTIFACTTYPE-PROVISIONAL[number]
-            pattern = r'^([A-Z]+)-PROVISIONAL\d*$'
-            match = re.match(pattern, name_without_ext.upper())
+            match = self._provisional_filename_re.match(name_without_ext.upper())
             
             if not match:
                 result["error"] = f"Filename '{filename}' does not match provisional pattern (ARTIFACTTYPE-PROVISIONAL[number].md)"
@@ -607,20 +695,31 @@ class ArtifactTypeManager:
                 result["error"] = f"Invalid artifact type '{artifact_type}'. Valid types: {valid_types}"
                 return json.dumps(result)
             
-            # If we get here, everything is valid
-            result["valid"] = True
-            result["artifact_type"] = artifact_type
-            
-            return json.dumps(result)
-            
+            # Happy path: build the JSON directly rather than walking the
+            # result dict through the encoder. artifact_type is [A-Z]+ from
+            # the pattern match; only the filename needs quoting
+            return (
+                f'{{"valid": true, "artifact_type": "{artifact_type}", '
+                f'"filename": {json.dumps(filename)}, "error": null}}'
+            )
+
         except Exception as e:
             result["error"] = f"Error validating filename: {str(e)}"
             return json.dumps(result)
 
 
+# Managers are cached per resolved config path: the config files are static
+# for the life of the process, so re-reading and re-parsing them on every
+# factory call is wasted I/O
+_MANAGER_CACHE: Dict[str, ArtifactTypeManager] = {}
+
+
 def get_artifact_type_manager(config_path: Optional[str] = None) -> ArtifactTypeManager:
-    """Factory function to create an ArtifactTypeManager instance.
-    
+    """Factory function returning a shared ArtifactTypeManager instance.
+
+    Instances are cached per config path, so repeated calls reuse the
+    already-parsed configuration instead of re-reading it from disk.
+
     Args:
         config_path: Path to the artifact_types.json config file.
                     If None, uses default location.
@@ -631,4 +730,11 @@ def get_artifact_type_manager(config_path: Optional[str] = None) -> ArtifactType
     Raises:
         ValueError: If config file is not found or invalid
     """
-    return ArtifactTypeManager(config_path)
+    if config_path is None:
+        config_path = str(Path(__file__).parent / "artifact_types.json")
+    cache_key = str(Path(config_path).resolve())
+
+    manager = _MANAGER_CACHE.get(cache_key)
+    if manager is None:
+        manager = _MANAGER_CACHE.setdefault(cache_key, ArtifactTypeManager(config_path))
+    return manager
@@ -32,6 +32,15 @@ class DocumentTemplateManager:
         self.template_store_path = Path(template_store_path)
         if not self.template_store_path.exists():
             raise ValueError(f"Template store path does not exist: {self.template_store_path}")
+        self._type_manager = get_artifact_type_manager()
+        # Templates are static for the life of the process; cache contents
+        # per artifact type after the first read
+        self._template_cache: Dict[str, str] = {}
+        # Snapshot the template directory names once for error messages,
+        # instead of rescanning the store on every miss
+        self._available_artifacts = tuple(
+            sorted(d.name for d in self.template_store_path.iterdir() if d.is_dir())
+        )
         logger.info(f"Initialized DocumentTemplateManager with template store: {self.template_store_path}")
         
     def get_document_template(self, artifact_name: str) -> str:
@@ -48,30 +57,35 @@ class DocumentTemplateManager:
         """
         # Validate artifact type using the artifact type manager
         try:
-            type_manager = get_artifact_type_manager()
-            normalized_artifact_name = type_manager.validate_and_normalize_artifact_type(artifact_name)
+            normalized_artifact_name = self._type_manager.validate_and_normalize_artifact_type(artifact_name)
             # Use the artifact name directly for template directory lookup, not the template_name format
             template_dir_name = normalized_artifact_name
         except ValueError as e:
             logger.error(f"Invalid artifact type '{artifact_name}': {e}")
             raise
-        
+
+        cached = self._template_cache.get(normalized_artifact_name)
+        if cached is not None:
+            return cached
+
         artifact_dir = self.template_store_path / template_dir_name
         template_file = artifact_dir / "template.md"
-        
-        if not template_file.exists():
-            available_artifacts = [d.name for d in self.template_store_path.iterdir() if d.is_dir()]
-            raise ValueError(f"Template not found for artifact '{artifact_name}' (template directory: {template_dir_name}). Available artifacts: {available_artifacts}")
-        
+
+        # No exists() pre-check: the read itself reports a missing file,
+        # saving a stat call and avoiding the check/open race
         try:
-            with open(template_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            logger.info(f"Successfully loaded template for artifact: {artifact_name}")
-            return content
+            content = template_file.read_text(encoding='utf-8')
+        except FileNotFoundError:
+            available_artifacts = list(self._available_artifacts)
+            raise ValueError(f"Template not found for artifact '{artifact_name}' (template directory: {template_dir_name}). Available artifacts: {available_artifacts}")
         except Exception as e:
             logger.error(f"Error reading template file {template_file}: {e}")
             raise ValueError(f"Failed to read template for artifact '{artifact_name}': {e}")
 
+        logger.info(f"Successfully loaded template for artifact: {artifact_name}")
+        self._template_cache[normalized_artifact_name] = content
+        return content
+
 
 def get_template_manager(template_store_path: Optional[str] = None) -> DocumentTemplateManager:
     """Factory function to create a DocumentTemplateManager instance.
@@ -24,10 +24,16 @@ Available tools:
 """
 from __future__ import annotations
 
+import json
 import os
+import re
 import sys
 import logging
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
 from pathlib import Path
+from types import MappingProxyType
 
 # Add the parent directory to the path so we can import respect_manager
 current_dir = Path(__file__).parent
@@ -45,15 +51,114 @@ logging.basicConfig(level=logging.INFO)
 import respect_manager.artifact_manager as artifact_manager
 from respect_manager.template_manager import get_template_manager
 from respect_manager.artifact_type_manager import get_artifact_type_manager
+from respect_manager.artifact_type_handler import ArtifactHandlerFactory
+
+# Map mode names to instruction file names; read-only view so the
+# mapping can't be mutated at runtime
+_MODE_MAPPING = MappingProxyType({
+    "Generate PRD": "generate-prd.md",
+    "Generate TASKPRD": "generate-taskprd.md",
+    "Task Implementation": "execute-task.md",
+    "Setup PRD Tests": "setup-prd-tests.md",
+    "Review Architecture": "review-architecture.md",
+    "ReSpecT Master": "respect-master.md",
+    "Detect Project State": "detect-project-state.md",
+    "Acceptance Test": "acceptance-test.md",
+    "Failed Tests TASKPRD": "generate-taskprd-failed-test.md",
+    "PRD Review and Completion": "review-prd-complete.md",
+    "Architecture Summary": "architecture-summary.md",
+    "Architecture Review": "architecture-review-prd.md",
+})
+
+_AVAILABLE_MODES_STR = ", ".join(_MODE_MAPPING.keys())
+
+_INSTRUCTIONS_DIR = Path(__file__).parent.parent / "instructions"
+
+# Common TYPE-NUMBER (or TYPE-PROVISIONALn) artifact ID shape
+_ARTIFACT_ID_RE = re.compile(r"^([A-Z]+)-(\d+|PROVISIONAL\d+)$", re.IGNORECASE)
+
+# Set once at process start via mcp.json/shell; read it once
+_PROVISIONAL_STORE = os.getenv("RESPECT_PROVISIONAL_DOC_STORE", "")
+
+# Shared error strings for the handler-dispatch tools
+_ERR_UNEXPECTED_HANDLER = "Error: Unexpected handler response"
+_err_no_handler = "Error: No handler available for artifact type {}".format
+
+
+def _tool_errors(fn):
+    """Convert uncaught exceptions from a tool body into the standard error string."""
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        try:
+            return fn(*args, **kwargs)
+        except Exception as e:
+            return f"Error: {str(e)}"
+    return wrapper
+
+
+@lru_cache(maxsize=16)
+def _addable_nested(parent_type: str) -> frozenset:
+    """Nested artifact types a parent type accepts; fixed by the type config."""
+    info = get_artifact_type_manager().get_artifact_type_info(parent_type)
+    return frozenset(info.get("addable_nested_artifact_types", []))
+
+try:
+    # orjson is optional; serialization falls back to the stdlib encoder
+    import orjson
+
+    def _dumps_indented(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _dumps_indented(obj) -> str:
+        return json.dumps(obj, indent=2)
+
+# Shared template manager; the factory builds a fresh instance (and rescans
+# the template store) on every call, so hold one for the process
+_template_manager = lru_cache(maxsize=1)(get_template_manager)
+
+# Shared ArtifactManager for tool calls, rebuilt only if the repo root
+# environment variable changes
+_ID_MANAGER = None
+
+
+def _id_manager():
+    global _ID_MANAGER
+    repo_root = os.getenv('RESPECT_DOC_REPO_ROOT')
+    if _ID_MANAGER is None or str(_ID_MANAGER.repo_root) != repo_root:
+        _ID_MANAGER = artifact_manager.get_artifact_id_manager()
+    return _ID_MANAGER
+
+
+@lru_cache(maxsize=1)
+def _render_valid_artifact_types() -> str:
+    """Render the artifact-type listing once; the type config is static."""
+    all_types = get_artifact_type_manager().get_all_artifact_types_info()
+    return "Valid Artifact Types:\n\n" + "".join(
+        f"{artifact_type}: {info['name']}\n"
+        f"  Description: {info['description']}\n"
+        f"  Template: {info['template_name']}\n\n"
+        for artifact_type, info in all_types.items()
+    )
+
+
+@lru_cache(maxsize=64)
+def _load_instruction(instruction_file: str) -> str:
+    """Read an instruction file, caching contents for repeated mode fetches.
+
+    Failed reads raise, so they are not cached and a file added later is
+    picked up on the next call.
+    """
+    return (_INSTRUCTIONS_DIR / instruction_file).read_text(encoding='utf-8')
 
 
 @app.tool()
 def get_provisional_store() -> str:
     """Return the ReSpecT provisional document store root path."""
-    return os.getenv("RESPECT_PROVISIONAL_DOC_STORE", "")
+    return _PROVISIONAL_STORE
 
 
 @app.tool()
+@_tool_errors
 def get_document_template(artifact_type: str) -> str:
     """Get a document template by artifact type.
     
@@ -63,19 +168,16 @@ def get_document_template(artifact_type: str) -> str:
     Returns:
         The template content as a string
     """
-    try:
-        template_manager = get_template_manager()
-        
-        # Get the template content
-        template_content = template_manager.get_document_template(artifact_type)
-        
-        return template_content
-        
-    except Exception as e:
-        return f"Error: {str(e)}"
+    template_manager = _template_manager()
+    
+    # Get the template content
+    template_content = template_manager.get_document_template(artifact_type)
+    
+    return template_content
 
 
 @app.tool()
+@_tool_errors
 def get_mode_instructions(mode: str) -> str:
     """Get mode instructions by fetching content from instruction files.
     
@@ -85,76 +187,30 @@ def get_mode_instructions(mode: str) -> str:
     Returns:
         The instruction file content as a string
     """
+    # Get the instruction file name
+    instruction_file = _MODE_MAPPING.get(mode)
+    if not instruction_file:
+        return f"Error: Unknown mode '{mode}'. Available modes: {_AVAILABLE_MODES_STR}"
+
     try:
-        # Map mode names to instruction file names
-        mode_mapping = {
-            "Generate PRD": "generate-prd.md",
-            "Generate TASKPRD": "generate-taskprd.md",
-            "Task Implementation": "execute-task.md",
-            "Setup PRD Tests": "setup-prd-tests.md",
-            "Review Architecture": "review-architecture.md",
-            "ReSpecT Master": "respect-master.md",
-            "Detect Project State": "detect-project-state.md",
-            "Acceptance Test": "acceptance-test.md",
-            "Failed Tests TASKPRD":"generate-taskprd-failed-test.md",
-            "PRD Review and Completion":"review-prd-complete.md",
-            "Architecture Summary":"architecture-summary.md",
-            "Architecture Review":"architecture-review-prd.md",
-        }
-        
-        # Get the instruction file name
-        instruction_file = mode_mapping.get(mode)
-        if not instruction_file:
-            available_modes = ", ".join(mode_mapping.keys())
-            return f"Error: Unknown mode '{mode}'. Available modes: {available_modes}"
-        
-        # Build the path to the instruction file
-        current_dir = Path(__file__).parent
-        project_root = current_dir.parent
-        instructions_dir = project_root / "instructions"
-        instruction_path = instructions_dir / instruction_file
-        
-        # Check if file exists
-        if not instruction_path.exists():
-            return f"Error: Instruction file not found at {instruction_path}"
-        
-        # Read and return the file content
-        with open(instruction_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        return content
-        
-    except Exception as e:
-        return f"Error: {str(e)}"
+        return _load_instruction(instruction_file)
+    except FileNotFoundError:
+        return f"Error: Instruction file not found at {_INSTRUCTIONS_DIR / instruction_file}"
 
 
 @app.tool()
+@_tool_errors
 def get_valid_artifact_types() -> str:
     """Get a list of all valid artifact types and their information.
     
     Returns:
         JSON string containing artifact type definitions
     """
-    try:
-        type_manager = get_artifact_type_manager()
-        
-        # Get all artifact types info
-        all_types = type_manager.get_all_artifact_types_info()
-        
-        # Format as a readable string
-        result = "Valid Artifact Types:\n\n"
-        for artifact_type, info in all_types.items():
-            result += f"{artifact_type}: {info['name']}\n"
-            result += f"  Description: {info['description']}\n"
-            result += f"  Template: {info['template_name']}\n\n"
-        
-        return result
-        
-    except Exception as e:
-        return f"Error: {str(e)}"
+    return _render_valid_artifact_types()
 
 
 @app.tool()
+@_tool_errors
 def search_artifacts_by_id(identifier: str, search_references: str = "true") -> str:
     """Find artifacts by document ID (integer) or artifact ID.
     
@@ -178,45 +234,41 @@ def search_artifacts_by_id(identifier: str, search_references: str = "true") ->
     Returns:
         JSON-formatted string with categorized artifact information, or error message if not found
     """
-    try:
-        # Convert string parameter to boolean
-        search_refs_bool = search_references.lower() in ("true", "1", "yes", "on")
-        
-        # Get the artifact ID manager and delegate to it
-        manager = artifact_manager.get_artifact_id_manager()
-        result = manager.search_artifacts_by_id(identifier, search_refs_bool)
-        
-        if not result.get("success"):
-            return f"Error: {result.get('message', 'Unknown error')}"
-        
-        # Format the response as structured JSON
-        direct_matches = result.get("direct_matches", [])
-        content_references = result.get("content_references", [])
-        
-        if not direct_matches and not content_references:
-            return f"No artifacts found for identifier: {identifier}"
-        
-        # Build structured response
-        response = {
-            "identifier": identifier,
-            "search_references": search_refs_bool,
-            "direct_matches": direct_matches,
-            "content_references": content_references,
-            "summary": {
-                "direct_matches_count": len(direct_matches),
-                "content_references_count": len(content_references),
-                "total_found": len(direct_matches) + len(content_references)
-            }
+    # Convert string parameter to boolean
+    search_refs_bool = search_references.lower() in ("true", "1", "yes", "on")
+    
+    # Get the artifact ID manager and delegate to it
+    manager = _id_manager()
+    result = manager.search_artifacts_by_id(identifier, search_refs_bool)
+    
+    if not result.get("success"):
+        return f"Error: {result.get('message', 'Unknown error')}"
+    
+    # Format the response as structured JSON
+    direct_matches = result.get("direct_matches", [])
+    content_references = result.get("content_references", [])
+    
+    if not direct_matches and not content_references:
+        return f"No artifacts found for identifier: {identifier}"
+    
+    # Build structured response
+    response = {
+        "identifier": identifier,
+        "search_references": search_refs_bool,
+        "direct_matches": direct_matches,
+        "content_references": content_references,
+        "summary": {
+            "direct_matches_count": len(direct_matches),
+            "content_references_count": len(content_references),
+            "total_found": len(direct_matches) + len(content_references)
         }
-        
-        import json
-        return json.dumps(response, indent=2)
-        
-    except Exception as e:
-        return f"Error: {str(e)}"
+    }
+    
+    return _dumps_indented(response)
 
 
 @app.tool()
+@_tool_errors
 def get_artifact(identifier: str) -> str:
     """Get the full content of a specific artifact by document ID or artifact ID.
     
@@ -231,31 +283,28 @@ def get_artifact(identifier: str) -> str:
     Returns:
         The full content of the artifact file or extracted section, with metadata
     """
-    try:
-        # Get the artifact ID manager and delegate to it
-        manager = artifact_manager.get_artifact_id_manager()
-        result = manager.get_artifact(identifier)
-        
-        if not result.get("success"):
-            return f"Error: {result.get('message', 'Unknown error')}"
-        
-        # Return the content with some metadata (excluding file path for security)
-        content = result.get("content", "")
-        artifact_info = result.get("artifact_info", {})
-        
-        response = f"# Content for {artifact_info.get('artifact_id', identifier)}\n"
-        response += f"**Status:** {artifact_info.get('status', 'Unknown')}\n"
-        response += f"**Name:** {artifact_info.get('name', 'Unknown')}\n\n"
-        response += "---\n\n"
-        response += content
-        
-        return response
-        
-    except Exception as e:
-        return f"Error: {str(e)}"
+    # Get the artifact ID manager and delegate to it
+    manager = _id_manager()
+    result = manager.get_artifact(identifier)
+    
+    if not result.get("success"):
+        return f"Error: {result.get('message', 'Unknown error')}"
+    
+    # Return the content with some metadata (excluding file path for security)
+    content = result.get("content", "")
+    artifact_info = result.get("artifact_info", {})
+    
+    return (
+        f"# Content for {artifact_info.get('artifact_id', identifier)}\n"
+        f"**Status:** {artifact_info.get('status', 'Unknown')}\n"
+        f"**Name:** {artifact_info.get('name', 'Unknown')}\n\n"
+        f"---\n\n"
+        f"{content}"
+    )
 
 
 @app.tool()
+@_tool_errors
 def search_artifacts_by_type(artifact_type: str, status: str = "", parent: str = "") -> str:
     """Search for artifacts by type and optionally by status and parent.
     
@@ -270,73 +319,91 @@ def search_artifacts_by_type(artifact_type: str, status: str = "", parent: str =
     Returns:
         JSON-formatted string with matching artifacts, or error message if none found
     """
-    try:
-        # Get the artifact ID manager
-        manager = artifact_manager.get_artifact_id_manager()
-        
-        # Convert empty strings to None for optional parameters
-        status_filter = status if status and status.strip() else None
-        parent_filter = parent if parent and parent.strip() else None
-        
-        # Parse artifact types (comma-separated)
-        artifact_types = [t.strip().upper() for t in artifact_type.split(',') if t.strip()]
-        
-        if not artifact_types:
-            return "Error: No valid artifact types provided"
-        
-        # Aggregate results from all artifact types
-        all_artifacts = []
-        by_type_summary = {}
-        errors = []
-        
+    # Get the artifact ID manager
+    manager = _id_manager()
+    
+    # Convert empty strings to None for optional parameters
+    status_filter = status if status and status.strip() else None
+    parent_filter = parent if parent and parent.strip() else None
+    
+    # Parse artifact types (comma-separated), dropping duplicates and
+    # malformed entries so each distinct type costs one backend call
+    artifact_types = list(dict.fromkeys(
+        t.strip().upper()
+        for t in artifact_type.split(',')
+        if t.strip() and t.strip().isalpha()
+    ))
+
+    if not artifact_types:
+        return "Error: No valid artifact types provided"
+    
+    # Aggregate results from all artifact types. Per-type searches are
+    # independent, I/O-bound index reads, so multi-type queries run them
+    # concurrently
+    all_artifacts = []
+    by_type_summary = {}
+    errors = []
+
+    def _collect(single_type, result):
+        if result.get("success"):
+            type_artifacts = result.get("artifacts", [])
+            all_artifacts.extend(type_artifacts)
+            by_type_summary[single_type] = len(type_artifacts)
+        else:
+            by_type_summary[single_type] = 0
+            errors.append(f"{single_type}: {result.get('message', 'Unknown error')}")
+
+    if len(artifact_types) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(artifact_types))) as executor:
+            futures = {
+                single_type: executor.submit(
+                    manager.search_artifacts_by_type, single_type, status_filter, parent_filter
+                )
+                for single_type in artifact_types
+            }
+        # Resolve in request order so output ordering matches the serial path
         for single_type in artifact_types:
             try:
-                result = manager.search_artifacts_by_type(single_type, status_filter, parent_filter)
-                
-                if result.get("success"):
-                    type_artifacts = result.get("artifacts", [])
-                    all_artifacts.extend(type_artifacts)
-                    by_type_summary[single_type] = len(type_artifacts)
-                else:
-                    by_type_summary[single_type] = 0
-                    errors.append(f"{single_type}: {result.get('message', 'Unknown error')}")
-                    
+                _collect(single_type, futures[single_type].result())
             except Exception as e:
                 by_type_summary[single_type] = 0
                 errors.append(f"{single_type}: {str(e)}")
-        
-        # Build structured response
-        response = {
-            "artifact_types": artifact_types,
-            "status_filter": status_filter,
-            "parent_filter": parent_filter,
-            "artifacts": all_artifacts,
-            "summary": {
-                "total_found": len(all_artifacts),
-                "by_type": by_type_summary,
-                "by_status": {}
-            }
+    else:
+        for single_type in artifact_types:
+            try:
+                _collect(single_type, manager.search_artifacts_by_type(single_type, status_filter, parent_filter))
+            except Exception as e:
+                by_type_summary[single_type] = 0
+                errors.append(f"{single_type}: {str(e)}")
+    
+    # Build structured response
+    response = {
+        "artifact_types": artifact_types,
+        "status_filter": status_filter,
+        "parent_filter": parent_filter,
+        "artifacts": all_artifacts,
+        "summary": {
+            "total_found": len(all_artifacts),
+            "by_type": by_type_summary,
+            "by_status": {}
         }
-        
-        # Add errors if any occurred
-        if errors:
-            response["errors"] = errors
-        
-        # Count artifacts by status for summary
-        for artifact in all_artifacts:
-            artifact_status = artifact.get("status") or "NO_STATUS"
-            if artifact_status != "NO_STATUS":
-                artifact_status = artifact_status.upper()
-            response["summary"]["by_status"][artifact_status] = response["summary"]["by_status"].get(artifact_status, 0) + 1
-        
-        import json
-        return json.dumps(response, indent=2)
-        
-    except Exception as e:
-        return f"Error: {str(e)}"
+    }
+    
+    # Add errors if any occurred
+    if errors:
+        response["errors"] = errors
+    
+    # Count artifacts by status for summary
+    response["summary"]["by_status"] = dict(Counter(
+        status.upper() if (status := artifact.get("status")) else "NO_STATUS"
+        for artifact in all_artifacts
+    ))
+    
+    return _dumps_indented(response)
 
 
 @app.tool()
+@_tool_errors
 def update_artifact_status(artifact_id: str, status: str) -> str:
     """Update the STATUS of an artifact in the repository.
     
@@ -358,49 +425,44 @@ def update_artifact_status(artifact_id: str, status: str) -> str:
     Returns:
         Status message with details of what was updated, or error message with valid statuses if invalid
     """
-    try:
-        # Import here to avoid circular imports
-        from respect_manager.artifact_type_manager import get_artifact_type_manager
-        
-        # Pre-validate artifact ID format if it's not a pure number (document ID)
-        if not artifact_id.isdigit():
-            type_manager = get_artifact_type_manager()
-            validation = type_manager.validate_artifact_id_format(artifact_id)
-            
-            if not validation["valid"]:
-                error_msg = f"Invalid artifact ID format: {validation['error']}"
-                if validation.get("suggestions"):
-                    error_msg += f"\n\nSuggestions:\n" + "\n".join(f"  • {s}" for s in validation["suggestions"])
-                return f"Error: {error_msg}"
-        
-        # Get the artifact ID manager
-        manager = artifact_manager.get_artifact_id_manager()
-        
-        # Update the artifact status
-        result = manager.update_artifact_status(artifact_id, status)
+    # Pre-validate artifact ID format if it's not a pure number (document ID)
+    if not artifact_id.isdigit():
+        type_manager = get_artifact_type_manager()
+        validation = type_manager.validate_artifact_id_format(artifact_id)
         
-        if not result.get("success"):
-            error_msg = result.get("error", "Unknown error")
-            if "valid_statuses" in result:
-                valid_statuses = result["valid_statuses"]
-                artifact_type = result.get("artifact_type", "")
-                type_info = f" for {artifact_type}" if artifact_type else ""
-                return f"{error_msg}\n\nValid statuses{type_info}: {', '.join(valid_statuses)}"
+        if not validation["valid"]:
+            error_msg = f"Invalid artifact ID format: {validation['error']}"
+            if validation.get("suggestions"):
+                error_msg += f"\n\nSuggestions:\n" + "\n".join(f"  • {s}" for s in validation["suggestions"])
             return f"Error: {error_msg}"
-        
-        # Format the successful result
-        response = f"Successfully updated status for {result['artifact_id']} to {result['status']}\n\n"
-        response += "Updates performed:\n"
-        for update in result["updates"]:
-            response += f"  - {update}\n"
-        
-        return response
-        
-    except Exception as e:
-        return f"Error: {str(e)}"
+    
+    # Get the artifact ID manager
+    manager = _id_manager()
+    
+    # Update the artifact status
+    result = manager.update_artifact_status(artifact_id, status)
+    
+    if not result.get("success"):
+        error_msg = result.get("error", "Unknown error")
+        if "valid_statuses" in result:
+            valid_statuses = result["valid_statuses"]
+            artifact_type = result.get("artifact_type", "")
+            type_info = f" for {artifact_type}" if artifact_type else ""
+            return f"{error_msg}\n\nValid statuses{type_info}: {', '.join(valid_statuses)}"
+        return f"Error: {error_msg}"
+    
+    # Format the successful result
+    parts = [
+        f"Successfully updated status for {result['artifact_id']} to {result['status']}\n\n",
+        "Updates performed:\n",
+    ]
+    parts.extend(f"  - {update}\n" for update in result["updates"])
+
+    return "".join(parts)
 
 
 @app.tool()
+@_tool_errors
 def finalize_prov_file(provisional_file_name: str, file_name_suffix: str | None = None) -> str:
     """Finalize a provisional document by finding it in the provisional store, assigning proper artifact IDs, and saving to the document repository.
     
@@ -411,47 +473,46 @@ def finalize_prov_file(provisional_file_name: str, file_name_suffix: str | None
     Returns:
         Status message with source and target paths, and ID mappings
     """
-    try:
-        # Validate input
-        if not provisional_file_name:
-            return "Error: provisional_file_name is required"
-        # Validate optional suffix length if provided
-        if file_name_suffix is not None and len(file_name_suffix) > 50:
-            return "Error: file_name_suffix must be 50 characters or fewer"
-
-        # Get the artifact ID manager and delegate to it
-        manager = artifact_manager.get_artifact_id_manager()
-        result = manager.finalize_provisional_file(provisional_file_name, file_name_suffix)
-        
-        # Format the response
-        if not result.get("id_mappings"):
-            return f"No provisional artifact IDs found in {provisional_file_name}"
-        
-        response = f"Successfully finalized provisional document\n"
-        if result.get("target"):
-            response += f"Source: {result['source_filename']}\n"
-            response += f"Target: {result['target']}\n\n"
-        response += "ID mappings:\n"
-        for provisional_id, new_id in result["id_mappings"].items():
-            response += f"  {provisional_id} -> {new_id}\n"
-        
-        # Include handler result if available
-        if "handler_result" in result:
-            handler_result = result["handler_result"]
-            response += f"\nPost-finalization handler:\n"
-            response += f"  Type: {handler_result.get('handler_type', 'Unknown')}\n"
-            response += f"  Status: {handler_result.get('status', 'Unknown')}\n"
-            response += f"  Message: {handler_result.get('message', 'No message')}\n"
-            if "actions_performed" in handler_result:
-                response += f"  Actions: {', '.join(handler_result['actions_performed'])}\n"
-        
-        return response
-        
-    except Exception as e:
-        return f"Error: {str(e)}"
+    # Validate input
+    if not provisional_file_name:
+        return "Error: provisional_file_name is required"
+    # Validate optional suffix length if provided
+    if file_name_suffix is not None and len(file_name_suffix) > 50:
+        return "Error: file_name_suffix must be 50 characters or fewer"
+
+    # Get the artifact ID manager and delegate to it
+    manager = _id_manager()
+    result = manager.finalize_provisional_file(provisional_file_name, file_name_suffix)
+    
+    # Format the response
+    if not result.get("id_mappings"):
+        return f"No provisional artifact IDs found in {provisional_file_name}"
+    
+    parts = ["Successfully finalized provisional document\n"]
+    if result.get("target"):
+        parts.append(f"Source: {result['source_filename']}\n")
+        parts.append(f"Target: {result['target']}\n\n")
+    parts.append("ID mappings:\n")
+    parts.extend(
+        f"  {provisional_id} -> {new_id}\n"
+        for provisional_id, new_id in result["id_mappings"].items()
+    )
+
+    # Include handler result if available
+    if "handler_result" in result:
+        handler_result = result["handler_result"]
+        parts.append("\nPost-finalization handler:\n")
+        parts.append(f"  Type: {handler_result.get('handler_type', 'Unknown')}\n")
+        parts.append(f"  Status: {handler_result.get('status', 'Unknown')}\n")
+        parts.append(f"  Message: {handler_result.get('message', 'No message')}\n")
+        if "actions_performed" in handler_result:
+            parts.append(f"  Actions: {', '.join(handler_result['actions_performed'])}\n")
+
+    return "".join(parts)
 
 
 @app.tool()
+@_tool_errors
 def update_artifact_content(identifier: str, content: str) -> str:
     """Update the CONTENT/TEXT of an artifact by identifier (doc ID or artifact ID).
     
@@ -471,19 +532,23 @@ def update_artifact_content(identifier: str, content: str) -> str:
     Returns:
         Status message indicating success or detailed error.
     """
-    try:
-        manager = artifact_manager.get_artifact_id_manager()
-        result = manager.update_artifact(identifier, content)
-        if not result.get("success"):
-            return f"Error: {result.get('message', 'Unknown error')}"
+    # Fail fast on inputs that can never succeed, before any file I/O
+    if not identifier or not identifier.strip():
+        return "Error: identifier is required"
+    if not isinstance(content, str):
+        return "Error: content must be a non-null string"
+
+    manager = _id_manager()
+    result = manager.update_artifact(identifier, content)
+    if not result.get("success"):
+        return f"Error: {result.get('message', 'Unknown error')}"
 
-        artifact_id = result.get("artifact_id") or identifier
-        return f"Successfully updated {artifact_id}"
-    except Exception as e:
-        return f"Error: {str(e)}"
+    artifact_id = result.get("artifact_id") or identifier
+    return f"Successfully updated {artifact_id}"
 
 
 @app.tool()
+@_tool_errors
 def mark_artifact_step_done(artifact_id: str, step_number: str) -> str:
     """Mark a step as done in a TASK artifact.
     
@@ -494,42 +559,39 @@ def mark_artifact_step_done(artifact_id: str, step_number: str) -> str:
     Returns:
         Success message or error description
     """
-    try:
-        # Extract artifact type from ID
-        if '-' not in artifact_id:
-            return f"Error: Invalid artifact ID format: {artifact_id}"
-        
-        artifact_type = artifact_id.split('-')[0].upper()
-        
-        # Validate artifact type supports steps using type manager
-        type_manager = get_artifact_type_manager()
-        
-        if not type_manager.has_capability(artifact_type, "has_steps"):
-            return f"Error: Artifact type {artifact_type} does not support step marking"
-        
-        # Get the appropriate handler
-        from respect_manager.artifact_type_handler import ArtifactHandlerFactory
-        handler = ArtifactHandlerFactory.get_handler(artifact_type)
-        
-        if not handler:
-            return f"Error: No handler available for artifact type {artifact_type}"
-        
-        # Get artifact manager
-        mgr = artifact_manager.get_artifact_id_manager()
-        
-        # Call the handler method (all handlers have this method, though not all implement it)
-        result = handler.mark_step_done(artifact_id, step_number, mgr)
-        
-        if not result.get("success"):
-            return f"Error: {result.get('message', 'Unknown error')}"
-        
-        return result.get("message", f"Successfully marked step {step_number} as done in {artifact_id}")
-        
-    except Exception as e:
-        return f"Error: {str(e)}"
+    # Extract artifact type from ID
+    id_match = _ARTIFACT_ID_RE.match(artifact_id)
+    if not id_match:
+        return f"Error: Invalid artifact ID format: {artifact_id}"
+
+    artifact_type = id_match.group(1).upper()
+    
+    # Validate artifact type supports steps using type manager
+    type_manager = get_artifact_type_manager()
+    
+    if not type_manager.has_capability(artifact_type, "has_steps"):
+        return f"Error: Artifact type {artifact_type} does not support step marking"
+    
+    # Get the appropriate handler
+    handler = ArtifactHandlerFactory.get_handler(artifact_type)
+    
+    if not handler:
+        return _err_no_handler(artifact_type)
+    
+    # Get artifact manager
+    mgr = _id_manager()
+    
+    # Call the handler method (all handlers have this method, though not all implement it)
+    result = handler.mark_step_done(artifact_id, step_number, mgr)
+    
+    if not result.get("success"):
+        return f"Error: {result.get('message', 'Unknown error')}"
+    
+    return result.get("message", f"Successfully marked step {step_number} as done in {artifact_id}")
 
 
 @app.tool()
+@_tool_errors
 def add_artifact(parent_artifact_id: str, new_artifact_type: str, new_artifact_content: str) -> str:
     """Add a nested artifact under a parent artifact when allowed by type config.
     
@@ -541,44 +603,40 @@ def add_artifact(parent_artifact_id: str, new_artifact_type: str, new_artifact_c
         new_artifact_type: Type of nested artifact (e.g., UACC or SACC)
         new_artifact_content: Markdown content to insert
     """
-    try:
-        # Setup managers
-        manager = artifact_manager.get_artifact_id_manager()
-        type_manager = get_artifact_type_manager()
-
-        # Validate parent id format and resolve type
-        normalized_parent_id = type_manager.validate_artifact_id(parent_artifact_id)
-        parent_type = type_manager.get_artifact_type_from_id(normalized_parent_id)
-
-        # Only PRD supported for now
-        if parent_type != "PRD":
-            return f"Error: add_artifact currently supports PRD as parent; got {parent_type}"
-
-        # Validate nested type against PRD's addable list
-        prd_info = type_manager.get_artifact_type_info("PRD")
-        allowed = set(prd_info.get("addable_nested_artifact_types", []))
-        normalized_new_type = type_manager.validate_and_normalize_artifact_type(new_artifact_type)
-        if normalized_new_type not in allowed:
-            return f"Error: {normalized_new_type} is not allowed under PRD. Allowed: {', '.join(sorted(allowed))}"
-
-        # Delegate to PRD handler
-        from respect_manager.artifact_type_handler import ArtifactHandlerFactory
-        handler = ArtifactHandlerFactory.get_handler("PRD")
-        add_fn = getattr(handler, 'add_nested_artifact', None) if handler else None
-        if not callable(add_fn):
-            return "Error: PRD handler does not support nested artifact insertion"
-
-        result = add_fn(normalized_parent_id, normalized_new_type, new_artifact_content, manager)
-        if not isinstance(result, dict):
-            return "Error: Unexpected handler response"
-        if not result.get("success"):
-            return f"Error: {result.get('message', 'Unknown error')}"
-        return result.get("message", "Successfully added nested artifact")
-    except Exception as e:
-        return f"Error: {str(e)}"
+    # Setup managers
+    manager = _id_manager()
+    type_manager = get_artifact_type_manager()
+
+    # Validate parent id format and resolve type
+    normalized_parent_id = type_manager.validate_artifact_id(parent_artifact_id)
+    parent_type = type_manager.get_artifact_type_from_id(normalized_parent_id)
+
+    # Only PRD supported for now
+    if parent_type != "PRD":
+        return f"Error: add_artifact currently supports PRD as parent; got {parent_type}"
+
+    # Validate nested type against PRD's addable list
+    allowed = _addable_nested("PRD")
+    normalized_new_type = type_manager.validate_and_normalize_artifact_type(new_artifact_type)
+    if normalized_new_type not in allowed:
+        return f"Error: {normalized_new_type} is not allowed under PRD. Allowed: {', '.join(sorted(allowed))}"
+
+    # Delegate to PRD handler
+    handler = ArtifactHandlerFactory.get_handler("PRD")
+    add_fn = getattr(handler, 'add_nested_artifact', None) if handler else None
+    if not callable(add_fn):
+        return "Error: PRD handler does not support nested artifact insertion"
+
+    result = add_fn(normalized_parent_id, normalized_new_type, new_artifact_content, manager)
+    if not isinstance(result, dict):
+        return _ERR_UNEXPECTED_HANDLER
+    if not result.get("success"):
+        return f"Error: {result.get('message', 'Unknown error')}"
+    return result.get("message", "Successfully added nested artifact")
 
 
 @app.tool()
+@_tool_errors
 def add_reference(target_artifact_id: str, ref_artifact_id: str) -> str:
     """Add a reference from one artifact to another.
     
@@ -592,51 +650,54 @@ def add_reference(target_artifact_id: str, ref_artifact_id: str) -> str:
     Returns:
         Status message indicating success or error
     """
+    # Setup managers
+    manager = _id_manager()
+    type_manager = get_artifact_type_manager()
+
+    # Cheap syntactic screen before full validation, so obviously
+    # malformed IDs skip the type-manager round trip. Strip first so the
+    # screen never rejects input the validator would accept
+    for label, aid in (("target", target_artifact_id), ("reference", ref_artifact_id)):
+        if not aid or not _ARTIFACT_ID_RE.match(aid.strip()):
+            return f"Error: Invalid {label} artifact ID format: {aid}"
+
+    # Validate target artifact ID format
     try:
-        # Setup managers
-        manager = artifact_manager.get_artifact_id_manager()
-        type_manager = get_artifact_type_manager()
+        normalized_target_id = type_manager.validate_artifact_id(target_artifact_id)
+    except ValueError as e:
+        return f"Error: Invalid target artifact ID: {str(e)}"
 
-        # Validate target artifact ID format
-        try:
-            normalized_target_id = type_manager.validate_artifact_id(target_artifact_id)
-        except ValueError as e:
-            return f"Error: Invalid target artifact ID: {str(e)}"
+    # Validate reference artifact ID format  
+    try:
+        normalized_ref_id = type_manager.validate_artifact_id(ref_artifact_id)
+    except ValueError as e:
+        return f"Error: Invalid reference artifact ID: {str(e)}"
 
-        # Validate reference artifact ID format  
-        try:
-            normalized_ref_id = type_manager.validate_artifact_id(ref_artifact_id)
-        except ValueError as e:
-            return f"Error: Invalid reference artifact ID: {str(e)}"
+    # Get the appropriate handler for the target artifact
+    target_type = type_manager.get_artifact_type_from_id(normalized_target_id)
 
-        # Get the appropriate handler for the target artifact
-        target_type = type_manager.get_artifact_type_from_id(normalized_target_id)
-        
-        from respect_manager.artifact_type_handler import ArtifactHandlerFactory
-        handler = ArtifactHandlerFactory.get_handler(target_type)
-        
-        if not handler:
-            return f"Error: No handler available for artifact type {target_type}"
-        
-        # Check if handler supports add_reference
-        add_ref_fn = getattr(handler, 'add_reference', None)
-        if not callable(add_ref_fn):
-            return f"Error: {target_type} handler does not support adding references"
+    handler = ArtifactHandlerFactory.get_handler(target_type)
+    
+    if not handler:
+        return _err_no_handler(target_type)
+    
+    # Check if handler supports add_reference
+    add_ref_fn = getattr(handler, 'add_reference', None)
+    if not callable(add_ref_fn):
+        return f"Error: {target_type} handler does not support adding references"
 
-        # Call the handler method
-        result = add_ref_fn(normalized_target_id, normalized_ref_id, manager)
-        
-        if not isinstance(result, dict):
-            return "Error: Unexpected handler response"
-        if not result.get("success"):
-            return f"Error: {result.get('message', 'Unknown error')}"
-        return result.get("message", "Successfully added reference")
-        
-    except Exception as e:
-        return f"Error: {str(e)}"
+    # Call the handler method
+    result = add_ref_fn(normalized_target_id, normalized_ref_id, manager)
+    
+    if not isinstance(result, dict):
+        return _ERR_UNEXPECTED_HANDLER
+    if not result.get("success"):
+        return f"Error: {result.get('message', 'Unknown error')}"
+    return result.get("message", "Successfully added reference")
 
 
 @app.tool()
+@_tool_errors
 def register_provisional_ids(artifact_id: str, allowed_types: str = "UACC,SACC") -> str:
     """Register provisional IDs found in an existing artifact without renaming the file.
     
@@ -653,75 +714,71 @@ def register_provisional_ids(artifact_id: str, allowed_types: str = "UACC,SACC")
     Returns:
         Status message with details of registered IDs or error information
     """
-    try:
-        # Setup manager
-        manager = artifact_manager.get_artifact_id_manager()
-        
-        # Parse allowed types
-        allowed_types_list = None
-        if allowed_types.strip():
-            allowed_types_list = [t.strip().upper() for t in allowed_types.split(",") if t.strip()]
-        
-        # Register provisional IDs
-        result = manager.register_provisional_ids(artifact_id, allowed_types_list)
-        
-        if not isinstance(result, dict):
-            return "Error: Unexpected manager response"
-        
-        if not result.get("success"):
-            return f"Error: {result.get('message', 'Unknown error')}"
-        
-        id_mappings = result.get("id_mappings", {})
-        if not id_mappings:
-            return result.get("message", "No provisional IDs found to register")
-        
-        # Format the response with mapping details and status updates
-        mapping_details = []
-        for provisional_id, new_id in id_mappings.items():
-            mapping_details.append(f"{provisional_id} -> {new_id}")
-        
-        base_message = result.get("message", "Successfully registered provisional IDs")
-        mapping_text = "\n".join(mapping_details)
-        
-        response = f"{base_message}\n\nID Mappings:\n{mapping_text}"
-        
-        # Add status update information if available
-        status_updates = result.get("status_updates", {})
-        if status_updates:
-            response += "\n\nStatus Updates:"
-            for artifact_id, status_info in status_updates.items():
-                if artifact_id == "error":
-                    response += f"\n  Error updating statuses: {status_info}"
-                else:
-                    success_status = "✓" if status_info.get("success") else "✗"
-                    response += f"\n  {success_status} {artifact_id}: {status_info.get('message', 'Unknown')}"
-        
-        # Add test coverage update information if available
-        test_coverage_updates = result.get("test_coverage_updates", {})
-        if test_coverage_updates and not test_coverage_updates.get("error"):
-            updated_reqs = test_coverage_updates.get("updated_reqs", [])
-            if updated_reqs:
-                response += f"\n\nTest Coverage Updates:"
-                response += f"\n  Updated {len(updated_reqs)} REQ artifact(s): {', '.join(updated_reqs)}"
-            
-            errors = test_coverage_updates.get("errors")
-            if errors:
-                response += f"\n  Errors: {len(errors)} error(s) occurred during test coverage updates"
-        elif test_coverage_updates and test_coverage_updates.get("error"):
-            response += f"\n\nTest Coverage Error: {test_coverage_updates.get('error')}"
-        
-        return response
-        
-    except Exception as e:
-        return f"Error: {str(e)}"
+    # Setup manager
+    manager = _id_manager()
+    
+    # Parse allowed types
+    allowed_types_list = None
+    if allowed_types.strip():
+        allowed_types_list = [t.strip().upper() for t in allowed_types.split(",") if t.strip()]
+    
+    # Register provisional IDs
+    result = manager.register_provisional_ids(artifact_id, allowed_types_list)
+    
+    if not isinstance(result, dict):
+        return "Error: Unexpected manager response"
+    
+    if not result.get("success"):
+        return f"Error: {result.get('message', 'Unknown error')}"
+    
+    id_mappings = result.get("id_mappings", {})
+    if not id_mappings:
+        return result.get("message", "No provisional IDs found to register")
+    
+    # Format the response with mapping details and status updates
+    mapping_text = "\n".join(
+        f"{provisional_id} -> {new_id}"
+        for provisional_id, new_id in id_mappings.items()
+    )
+
+    base_message = result.get("message", "Successfully registered provisional IDs")
+    parts = [f"{base_message}\n\nID Mappings:\n{mapping_text}"]
+
+    # Add status update information if available
+    status_updates = result.get("status_updates", {})
+    if status_updates:
+        parts.append("\n\nStatus Updates:")
+        for artifact_id, status_info in status_updates.items():
+            if artifact_id == "error":
+                parts.append(f"\n  Error updating statuses: {status_info}")
+            else:
+                success_status = "✓" if status_info.get("success") else "✗"
+                parts.append(f"\n  {success_status} {artifact_id}: {status_info.get('message', 'Unknown')}")
+
+    # Add test coverage update information if available
+    test_coverage_updates = result.get("test_coverage_updates", {})
+    coverage_error = test_coverage_updates.get("error") if test_coverage_updates else None
+    if coverage_error:
+        parts.append(f"\n\nTest Coverage Error: {coverage_error}")
+    elif test_coverage_updates:
+        updated_reqs = test_coverage_updates.get("updated_reqs", [])
+        if updated_reqs:
+            parts.append("\n\nTest Coverage Updates:")
+            parts.append(f"\n  Updated {len(updated_reqs)} REQ artifact(s): {', '.join(updated_reqs)}")
+
+        coverage_errors = test_coverage_updates.get("errors")
+        if coverage_errors:
+            parts.append(f"\n  Errors: {len(coverage_errors)} error(s) occurred during test coverage updates")
+
+    return "".join(parts)
 
 
 if __name__ == "__main__":  # pragma: no cover
-    if hasattr(app, "run_stdio"):
-        app.run_stdio() # type: ignore
-    elif hasattr(app, "serve"):
-        app.serve() # type: ignore
-    elif hasattr(app, "run"):
-        app.run()
-    else:
+    _entry = (
+        getattr(app, "run_stdio", None)
+        or getattr(app, "serve", None)
+        or getattr(app, "run", None)
+    )
+    if _entry is None:
         raise RuntimeError("FastMCP app has no run_stdio/run/serve method; cannot start.")
+    _entry()
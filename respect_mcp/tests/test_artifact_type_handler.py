@@ -0,0 +1,48 @@
+"""Regression tests for artifact_type_handler."""
+
+from respect_manager.artifact_type_handler import TaskPRDHandler
+
+
+def test_add_implementing_task_writes_managed_header():
+    """Adding a task to a REQ without an entry must produce the managed
+    `Implementing Tasks` header line, not the legacy body-line fallback."""
+    handler = TaskPRDHandler()
+    req_content = (
+        "### REQ-1: Sample requirement\n"
+        "`Status`: NEW\n"
+        "\n"
+        "The requirement body.\n"
+    )
+
+    updated = handler._add_or_update_implementing_task_line(req_content, ["TASK-10"])
+
+    assert "`Implementing Tasks`: TASK-10" in updated
+    assert "*Implementing Task*" not in updated
+
+
+def test_add_implementing_task_merges_existing_entries():
+    handler = TaskPRDHandler()
+    req_content = (
+        "### REQ-1: Sample requirement\n"
+        "`Status`: NEW\n"
+        "`Implementing Tasks`: TASK-9 (DONE)\n"
+        "\n"
+        "The requirement body.\n"
+    )
+
+    updated = handler._add_or_update_implementing_task_line(req_content, ["TASK-10"])
+
+    assert "`Implementing Tasks`: TASK-10,TASK-9 (DONE)" in updated
+
+
+def test_add_implementing_task_noop_when_already_recorded():
+    handler = TaskPRDHandler()
+    req_content = (
+        "### REQ-1: Sample requirement\n"
+        "`Status`: NEW\n"
+        "`Implementing Tasks`: TASK-10\n"
+        "\n"
+        "The requirement body.\n"
+    )
+
+    assert handler._add_or_update_implementing_task_line(req_content, ["TASK-10"]) is req_content